@@ -1,21 +1,71 @@
 """Command-line interface for nodepool."""
 
+from __future__ import annotations
+
 import asyncio
+import atexit
+import base64
+import contextlib
+import functools
+import json
+import re
 import sys
+import textwrap
+import traceback
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
 
 import click
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
-from nodepool.config_checker import ConfigChecker
-from nodepool.database import AsyncDatabase
-from nodepool.meshview_api import MeshViewAPIClient
-from nodepool.models import Node
-from nodepool.node_manager import NodeManager
+# nodepool modules are imported inside each command so that --help and shell
+# completion don't load pydantic, aiosqlite and friends
+if TYPE_CHECKING:
+    from nodepool.models import Node
 
 console = Console()
 
+# Discovery errors that just mean nothing answered on the port
+_NO_RESPONSE_RE = re.compile(r"No node info|Connection")
+
+# Maximum number of mDNS-discovered TCP nodes to connect to at once
+_MDNS_CONNECT_CONCURRENCY = 16
+
+
+def _uvloop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory if it can be used here.
+
+    Returns:
+        uvloop.new_event_loop, or None to use the default asyncio loop
+        (on Windows or when uvloop is not installed)
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+@functools.cache
+def _get_runner() -> asyncio.Runner:
+    """Return the event loop runner shared by all commands in this process.
+
+    Uses uvloop for the event loop when it is installed.
+
+    Returns:
+        Shared asyncio.Runner instance
+    """
+    runner = asyncio.Runner(loop_factory=_uvloop_factory())
+    atexit.register(runner.close)
+    return runner
+
 
 def run_async(coro):
     """Run an async coroutine from sync context.
@@ -26,19 +76,365 @@ def run_async(coro):
     Returns:
         Result of the coroutine
     """
-    if sys.version_info >= (3, 11):
-        # Python 3.11+ - use asyncio.Runner
-        with asyncio.Runner() as runner:
-            return runner.run(coro)
+    return _get_runner().run(coro)
+
+
+def _split_new_nodes(nodes: Iterable[Node], new_ids: set[str]) -> tuple[list[Node], list[Node]]:
+    """Partition nodes into new and already-known ones in a single pass.
+
+    Args:
+        nodes: Nodes to classify
+        new_ids: IDs of nodes that were inserted rather than updated
+
+    Returns:
+        Tuple of (new_nodes, updated_nodes)
+    """
+    new_nodes: list[Node] = []
+    updated_nodes: list[Node] = []
+    for node in nodes:
+        if node.id in new_ids:
+            new_nodes.append(node)
+        else:
+            updated_nodes.append(node)
+    return new_nodes, updated_nodes
+
+
+def _format_signal(node: Node) -> tuple[str, str]:
+    """Format a heard node's SNR and hop count for table display.
+
+    Args:
+        node: Heard node
+
+    Returns:
+        Tuple of (snr, hops) strings, using "?" for unknown values
+    """
+    snr = "?" if node.snr is None else f"{node.snr:.1f}"
+    hops = "?" if node.hops_away is None else str(node.hops_away)
+    return snr, hops
+
+
+# Modules listed by `info` only when enabled:
+# (config key, title, ((field, label, default, unit), ...))
+_INFO_MODULES: tuple[tuple[str, str, tuple[tuple[str, str, Any, str], ...]], ...] = (
+    (
+        "store_forward",
+        "Store & Forward",
+        (("records", "Records", 0, ""), ("heartbeat", "Heartbeat", False, "")),
+    ),
+    (
+        "range_test",
+        "Range Test",
+        (("sender", "Sender", 0, ""), ("save", "Save", False, "")),
+    ),
+    (
+        "external_notification",
+        "External Notification",
+        (
+            ("alert_message", "Alert on Message", False, ""),
+            ("alert_bell", "Alert on Bell", False, ""),
+        ),
+    ),
+    (
+        "serial_module",
+        "Serial Module",
+        (("baud", "Baud", 0, ""), ("echo", "Echo", False, "")),
+    ),
+    (
+        "neighbor_info",
+        "Neighbor Info",
+        (("update_interval", "Update Interval", 0, "s"),),
+    ),
+    (
+        "detection_sensor",
+        "Detection Sensor",
+        (("monitor_pin", "Monitor Pin", 0, ""),),
+    ),
+    (
+        "paxcounter",
+        "Paxcounter",
+        (("paxcounter_update_interval", "Update Interval", 0, "s"),),
+    ),
+)
+
+
+def _time_ago(timestamp_str: str) -> str:
+    """Format an ISO timestamp as relative time.
+
+    Args:
+        timestamp_str: ISO 8601 timestamp
+
+    Returns:
+        Relative time such as "5m ago", or the input if it cannot be parsed
+    """
+    try:
+        delta = datetime.now() - datetime.fromisoformat(timestamp_str)
+    except (TypeError, ValueError):
+        return timestamp_str
+
+    seconds = delta.total_seconds()
+    if seconds < 60:
+        return "just now"
+    elif seconds < 3600:
+        return f"{int(seconds / 60)}m ago"
+    elif seconds < 86400:
+        return f"{int(seconds / 3600)}h ago"
     else:
-        # Fallback for older Python
-        return asyncio.run(coro)
+        return f"{int(seconds / 86400)}d ago"
+
+
+def _config_section_lines(
+    title: str, section: dict, legacy_fields: tuple[tuple[str, str], ...]
+) -> list[str]:
+    """Render a LoRa/Device config section for `info`.
+
+    Sections retrieved with metadata (``_status``/``_retrieved_at``) list all
+    their fields; older configs only show the legacy fields.
+
+    Args:
+        title: Section title
+        section: Section config dictionary
+        legacy_fields: (key, label) pairs shown for configs without metadata
+
+    Returns:
+        Lines to print (empty if the section was not loaded)
+    """
+    if "_status" not in section:
+        lines = [f"  {title}:"]
+        lines.extend(f"    {label}: {section.get(key, 'Not set')}" for key, label in legacy_fields)
+        return lines
+
+    if section["_status"] != "loaded":
+        return []
+
+    timestamp = _time_ago(section.get("_retrieved_at", ""))
+    lines = [f"  {title} [dim]({timestamp})[/dim]:"]
+    # Skip metadata fields
+    lines.extend(f"    {key}: {value}" for key, value in section.items() if not key.startswith("_"))
+    return lines
+
+
+def _config_lines(config: dict) -> list[str]:
+    """Render the configuration and module sections shown by `info`.
+
+    Args:
+        config: Node configuration dictionary
+
+    Returns:
+        Lines to print, including Rich markup
+    """
+    lines = ["\n[bold]Configuration:[/bold]"]
+
+    if "lora" in config:
+        lines.extend(
+            _config_section_lines(
+                "LoRa", config["lora"], (("hopLimit", "Hop Limit"), ("region", "Region"))
+            )
+        )
+    if "device" in config:
+        lines.extend(_config_section_lines("Device", config["device"], (("role", "Role"),)))
+
+    if "security" in config:
+        security = config["security"]
+        lines.append("  Security:")
+
+        # Display admin keys (up to 3 slots)
+        admin_keys = security.get("admin_keys", [])
+        admin_keys_set = security.get("admin_keys_set", [])
+        if admin_keys:
+            lines.append(f"    Admin Keys: {len(admin_keys)} set")
+            for i, key_hex in enumerate(admin_keys):
+                slot = admin_keys_set[i] if i < len(admin_keys_set) else i
+                # Convert hex to base64 for display (matches Meshtastic app format)
+                key_b64 = base64.b64encode(bytes.fromhex(key_hex)).decode("ascii")
+                lines.append(f"      [{slot}] {key_b64}")
+        else:
+            lines.append("    Admin Keys: None set")
+
+        # Display PKI keys
+        if security.get("public_key"):
+            pub_key_b64 = base64.b64encode(bytes.fromhex(security["public_key"])).decode("ascii")
+            lines.append(f"    Public Key: {pub_key_b64}")
+        if security.get("private_key"):
+            lines.append("    Private Key: XXXXX--PRIVATE-KEY--XXXXX (hidden)")
+
+        lines.append(f"    Serial Enabled: {security.get('serial_enabled', 'Unknown')}")
+        lines.append(f"    Admin Channel Enabled: {security.get('admin_channel_enabled', False)}")
+        lines.append(f"    Managed: {security.get('is_managed', False)}")
+
+    if config.get("channels"):
+        lines.append("  Channels:")
+        for channel in config["channels"]:
+            psk = channel.get("psk")
+            psk_info = f" [PSK: {psk[:8]}...]" if psk else " [Not encrypted]"
+            lines.append(
+                f"    [{channel.get('index', '?')}] {channel.get('name', 'Unnamed')}{psk_info}"
+            )
+
+    if "position" in config:
+        pos = config["position"]
+        lines.append("  Position:")
+        if pos.get("position_broadcast_secs"):
+            interval_min = pos["position_broadcast_secs"] // 60
+            lines.append(f"    Broadcast: {pos['position_broadcast_secs']}s ({interval_min} min)")
+        lines.append(f"    Smart Mode: {pos.get('position_broadcast_smart_enabled', False)}")
+        lines.append(f"    GPS Enabled: {pos.get('gps_enabled', True)}")
+        lines.append(f"    Fixed Position: {pos.get('fixed_position', False)}")
+
+    # Module configs (only show enabled or configured modules)
+    lines.append("\n[bold]Modules:[/bold]")
+
+    mqtt = config.get("mqtt")
+    if mqtt and mqtt.get("enabled"):
+        map_reporting = mqtt.get("map_reporting_enabled", False)
+        map_note = "[green](OK to MQTT)[/green]" if map_reporting else "[dim](IGNORE MQTT)[/dim]"
+        lines.append("  [cyan]MQTT:[/cyan]")
+        lines.append(f"    Enabled: {mqtt['enabled']}")
+        if mqtt.get("address"):
+            lines.append(f"    Address: {mqtt['address']}")
+        lines.append(f"    Map Reporting: {map_reporting} {map_note}")
+        lines.append(f"    JSON: {mqtt.get('json_enabled', False)}")
+        lines.append(f"    TLS: {mqtt.get('tls_enabled', False)}")
+
+    telem = config.get("telemetry")
+    if telem and (
+        telem.get("device_update_interval") or telem.get("environment_measurement_enabled")
+    ):
+        lines.append("  [cyan]Telemetry:[/cyan]")
+        if telem.get("device_update_interval"):
+            lines.append(f"    Device Interval: {telem['device_update_interval']}s")
+        if telem.get("environment_update_interval"):
+            lines.append(f"    Environment Interval: {telem['environment_update_interval']}s")
+        lines.append(f"    Environment: {telem.get('environment_measurement_enabled', False)}")
+        lines.append(f"    Display °F: {telem.get('environment_display_fahrenheit', False)}")
+
+    for key, title, fields in _INFO_MODULES:
+        module = config.get(key)
+        if not module or not module.get("enabled"):
+            continue
+        lines.append(f"  [cyan]{title}:[/cyan]")
+        lines.append(f"    Enabled: {module['enabled']}")
+        lines.extend(
+            f"    {label}: {module.get(field, default)}{unit}"
+            for field, label, default, unit in fields
+        )
+
+    return lines
+
+
+def _export_record(node: Node, connection_string: str | None) -> dict:
+    """Build the export representation of a node.
+
+    Args:
+        node: Node to export
+        connection_string: Managed connection for the node, if any
+
+    Returns:
+        Dictionary ready for JSON/YAML serialization
+    """
+    return {
+        "id": node.id,
+        "short_name": node.short_name,
+        "long_name": node.long_name,
+        "connection_string": connection_string,
+        "hw_model": node.hw_model,
+        "firmware_version": node.firmware_version,
+        "last_seen": node.last_seen.isoformat(),
+        "is_active": node.is_active,
+        "config": node.config,
+    }
+
+
+def _print_once(*renderables: Any) -> None:
+    """Render output into one buffer and write it with a single call.
+
+    Highlighting is disabled so Rich does not run its repr regexes over
+    every line of table-style output.
+
+    Args:
+        renderables: Strings or Rich renderables, each printed on its own line
+    """
+    with console.capture() as capture:
+        for renderable in renderables:
+            console.print(renderable, highlight=False)
+    console.file.write(capture.get())
+    console.file.flush()
+
+
+def _write_export(path: Path, write: Callable[[TextIO], None]) -> None:
+    """Open a file for export and stream the document into it (blocking).
+
+    Args:
+        path: Destination file
+        write: Callable that writes the document to a text stream
+    """
+    with path.open("w", encoding="utf-8") as f:
+        write(f)
+
+
+def _get_json_dumps() -> Callable[..., str]:
+    """Return the JSON serializer used for export.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    Both write non-ASCII text (e.g. emoji short names) unescaped and parse
+    back to the same values, but the text can differ: orjson writes floats
+    more compactly (``1e16`` rather than ``1e+16``) and NaN/Infinity as
+    ``null`` where the standard library writes ``NaN``/``Infinity``.
+
+    Returns:
+        Callable taking an object and ``indent`` and returning a JSON string
+    """
+    stdlib_dumps = functools.partial(json.dumps, ensure_ascii=False)
+    try:
+        import orjson
+    except ImportError:
+        return stdlib_dumps
+
+    def dumps(obj: Any, indent: int = 2) -> str:
+        try:
+            # orjson only supports two-space indentation
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which the stdlib handles
+            return stdlib_dumps(obj, indent=indent)
+
+    return dumps
+
+
+def _iter_json_array(records: Iterable[dict], dumps: Callable[..., str]) -> Iterator[str]:
+    """Serialize records as a JSON array one element at a time.
+
+    The output matches ``dumps(list(records), indent=2)`` but only one record
+    is held in memory as a string at a time.
+
+    Args:
+        records: Dictionaries to serialize
+        dumps: JSON serializer accepting an ``indent`` keyword
+
+    Yields:
+        Chunks of the JSON document
+    """
+    separator = "[\n"
+    for record in records:
+        yield separator + textwrap.indent(dumps(record, indent=2), "  ")
+        separator = ",\n"
+    yield "[]" if separator == "[\n" else "\n]"
 
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(version="0.1.0")
-def cli():
+@click.pass_context
+def cli(ctx: click.Context):
     """Nodepool - Manage and maintain a group of Meshtastic nodes."""
+    # Commands share pooled database connections; close them on the way out,
+    # including when a command fails
+    ctx.call_on_close(_close_database_pool)
+
+
+def _close_database_pool() -> None:
+    """Close pooled database connections if a command opened any."""
+    database = sys.modules.get("nodepool.database")
+    if database is not None:
+        run_async(database.AsyncDatabase.close_pool())
 
 
 @cli.group()
@@ -65,7 +461,15 @@ def remote():
     help="Timeout in seconds to wait for ACK",
     type=int,
 )
-def pki_test(target_node_id: str, via_connection: str, message: str, timeout: int):
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Show the full traceback on failure",
+)
+def pki_test(
+    target_node_id: str, via_connection: str, message: str, timeout: int, verbose: bool
+):
     """Test PKI message delivery with ACK verification.
     
     Sends a message from a local node to a remote node over the mesh
@@ -85,6 +489,8 @@ def pki_test(target_node_id: str, via_connection: str, message: str, timeout: in
         target_node_id = f"!{target_node_id}"
     
     async def _pki_test():
+        from nodepool.node_manager import NodeManager
+
         console.print(f"\n[bold blue]PKI Message Test[/bold blue]")
         console.print(f"  From: {via_connection}")
         console.print(f"  To: {target_node_id}")
@@ -123,8 +529,7 @@ def pki_test(target_node_id: str, via_connection: str, message: str, timeout: in
         except Exception as e:
             console.print(f"\n[bold red]✗ ERROR[/bold red]")
             console.print(f"  {e}")
-            import traceback
-            if "--verbose" in sys.argv:
+            if verbose:
                 console.print(f"[dim]{traceback.format_exc()}[/dim]")
     
     run_async(_pki_test())
@@ -167,9 +572,10 @@ def remote_verify(target_node_id: str, via_node_id: str, db: str, timeout: int):
         via_node_id = f"!{via_node_id}"
     
     async def _remote_verify():
-        import base64
-        
-        async with AsyncDatabase(db) as database:
+        from nodepool.database import AsyncDatabase
+        from nodepool.node_manager import NodeManager
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
             
             # Get via node and its connection
@@ -328,7 +734,10 @@ def remote_config(
         via_node_id = f"!{via_node_id}"
     
     async def _remote_config():
-        async with AsyncDatabase(db) as database:
+        from nodepool.database import AsyncDatabase
+        from nodepool.node_manager import NodeManager
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
             
             # Get via node and its connection
@@ -367,10 +776,11 @@ def remote_config(
                 
                 # Save to database with mesh:// connection
                 mesh_connection = f"mesh://{via_node_id}"
-                async with AsyncDatabase(db) as database:
+                async with AsyncDatabase.acquire(db) as database:
                     await database.initialize()
-                    await database.save_node(node)
-                    await database.save_connection(node.id, mesh_connection)
+                    async with database.batch() as batch:
+                        batch.upsert_node(node)
+                        batch.save_connection(node.id, mesh_connection)
                 
                 console.print(f"[dim]Saved to database with connection: {mesh_connection}[/dim]")
                 console.print(f"\n[dim]View details with:[/dim]")
@@ -408,7 +818,9 @@ def connection():
 def connection_list(db: str):
     """List all managed node connections."""
     async def _connection_list():
-        async with AsyncDatabase(db) as database:
+        from nodepool.database import AsyncDatabase
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
             connections = await database.get_connected_nodes()
         
@@ -460,7 +872,9 @@ def connection_remove(node_id: str, db: str, yes: bool):
         node_id = f"!{node_id}"
     
     async def _connection_remove():
-        async with AsyncDatabase(db) as database:
+        from nodepool.database import AsyncDatabase
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
             
             # Get node info
@@ -501,7 +915,13 @@ def connection_remove(node_id: str, db: str, yes: bool):
     help="Database file path",
     type=click.Path(),
 )
-def connection_add(connection_string: str, db: str):
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Show the full traceback on failure",
+)
+def connection_add(connection_string: str, db: str, verbose: bool):
     """Add a managed node connection (serial or TCP).
     
     CONNECTION_STRING can be:
@@ -515,6 +935,9 @@ def connection_add(connection_string: str, db: str):
       nodepool connection add COM3
     """
     async def _connection_add():
+        from nodepool.database import AsyncDatabase
+        from nodepool.node_manager import NodeManager
+
         console.print(f"[bold blue]Connecting to node at {connection_string}...[/bold blue]")
         
         manager = NodeManager()
@@ -531,14 +954,13 @@ def connection_add(connection_string: str, db: str):
             
             # Save to database
             console.print("\nSaving to database...")
-            async with AsyncDatabase(db) as database:
+            async with AsyncDatabase.acquire(db) as database:
                 await database.initialize()
-                
-                # Save node info
-                await database.save_node(node)
-                
-                # Save connection (this makes it "managed")
-                await database.save_connection(node.id, connection_string)
+
+                # Save node info and its connection (this makes it "managed") together
+                async with database.batch() as batch:
+                    batch.upsert_node(node)
+                    batch.save_connection(node.id, connection_string)
             
             console.print(f"[green]✓ Successfully added managed node connection[/green]")
             console.print("\n[dim]Tips:[/dim]")
@@ -547,8 +969,7 @@ def connection_add(connection_string: str, db: str):
             
         except Exception as e:
             console.print(f"[red]✗ Failed to connect: {e}[/red]")
-            import traceback
-            if "--verbose" in sys.argv:
+            if verbose:
                 console.print(f"[dim]{traceback.format_exc()}[/dim]")
     
     run_async(_connection_add())
@@ -580,58 +1001,56 @@ def connection_add(connection_string: str, db: str):
 def discover(db: str, ports: tuple[str, ...], verbose: bool, network: bool):
     """Discover Meshtastic nodes on serial ports and optionally via mDNS on the local network."""
     async def _discover():
+        from nodepool.database import AsyncDatabase
+        from nodepool.models import Node
+        from nodepool.node_manager import NodeManager
+
         console.print("[bold blue]Discovering Meshtastic nodes...[/bold blue]")
 
         manager = NodeManager()
-        port_list = list(ports) if ports else None
+        # Note: the builtin list() is shadowed by the list command in this module
+        requested_ports = [*ports] if ports else None
+
+        async def _resolve_ports():
+            # Get list of ports to scan (skip if only doing network scan)
+            if network:
+                return []
+            if requested_ports is None:
+                return await manager._list_serial_ports()
+            return requested_ports
+
+        async def _load_existing_ids():
+            # Track which nodes are new vs already known
+            async with AsyncDatabase.acquire(db) as database:
+                await database.initialize()
+                return await database.get_all_node_ids()
 
-        # Get list of ports to scan (skip if only doing network scan)
-        if not network:
-            if port_list is None:
-                port_list = await manager._list_serial_ports()
+        # Port enumeration and the database read are independent
+        port_list, existing_node_ids = await asyncio.gather(
+            _resolve_ports(), _load_existing_ids()
+        )
 
+        if not network:
             if not port_list:
                 console.print("[yellow]No serial ports found to scan.[/yellow]")
                 console.print("[dim]Tip: Use --network flag to scan local network via mDNS[/dim]")
                 return
 
-            if port_list:
-                console.print(f"Scanning {len(port_list)} serial port(s)...\n")
-        else:
-            # Network-only mode, skip serial scanning
-            port_list = []
-
-        # Track discovered nodes
-        discovered = []
-
-        def progress_callback(port: str, result: Node | Exception):
-            """Handle progress updates during discovery."""
-            if isinstance(result, Node):
-                discovered.append(result)
-                console.print(
-                    f"  [green]✓[/green] {port} → [bold]{result.short_name}[/bold] "
-                    f"({result.hw_model})"
-                )
-            elif verbose:
-                # Only show failures in verbose mode
-                error_msg = str(result)
-                # Shorten common error messages
-                if "No node info" in error_msg or "Connection" in error_msg:
-                    error_msg = "No response"
-                console.print(f"  [dim]✗ {port} → {error_msg}[/dim]")
+            console.print(f"Scanning {len(port_list)} serial port(s)...\n")
 
         # Track which port each node was found on
         port_map = {}
-        
+        # Per-port results, printed together once the scan finishes
+        scan_lines = []
+
         def progress_callback_with_tracking(port: str, result: Node | Exception):
             """Handle progress updates and track successful port-node mappings."""
             if isinstance(result, Node):
                 port_map[result.id] = port
-                discovered.append(result)
                 # Check if this is a new or existing node
                 is_new = result.id not in existing_node_ids
                 status_text = "[cyan](new)[/cyan]" if is_new else "[dim](already known)[/dim]"
-                console.print(
+                scan_lines.append(
                     f"  [green]✓[/green] {port} → [bold]{result.short_name}[/bold] "
                     f"({result.hw_model}) {status_text}"
                 )
@@ -639,34 +1058,30 @@ def discover(db: str, ports: tuple[str, ...], verbose: bool, network: bool):
                 # Only show failures in verbose mode
                 error_msg = str(result)
                 # Shorten common error messages
-                if "No node info" in error_msg or "Connection" in error_msg:
+                if _NO_RESPONSE_RE.search(error_msg):
                     error_msg = "No response"
-                console.print(f"  [dim]✗ {port} → {error_msg}[/dim]")
+                scan_lines.append(f"  [dim]✗ {port} → {error_msg}[/dim]")
 
-        # Track which nodes are new vs already known
-        async with AsyncDatabase(db) as database:
-            await database.initialize()
-            existing_node_ids = {n.id for n in await database.get_all_nodes(active_only=False)}
-        
         # Discover serial nodes with progress callback
         if port_list:
-            nodes = await manager.discover_nodes(
-                serial_ports=port_list,
-                progress_callback=progress_callback_with_tracking
-            )
+            # Ports are scanned concurrently and reported once all finish
+            with console.status("[bold green]Scanning serial ports..."):
+                nodes = await manager.discover_nodes(
+                    serial_ports=port_list,
+                    progress_callback=progress_callback_with_tracking
+                )
+            if scan_lines:
+                console.print("\n".join(scan_lines))
         else:
             nodes = []
 
         # Discover mDNS nodes if --network flag is set
         if network:
             console.print("\nScanning local network via mDNS...\n")
-            
-            mdns_discovered = []
-            
+
             def mdns_progress_callback(connection_string: str, instance_name: str):
                 """Handle mDNS discovery progress."""
                 console.print(f"  Found: {instance_name} at {connection_string}")
-                mdns_discovered.append((connection_string, instance_name))
             
             # Discover via mDNS
             mdns_results = await manager.discover_mdns_nodes(
@@ -677,22 +1092,33 @@ def discover(db: str, ports: tuple[str, ...], verbose: bool, network: bool):
             # Try to connect to each discovered TCP node
             if mdns_results:
                 console.print(f"\nConnecting to {len(mdns_results)} discovered node(s)...\n")
-                
-                for connection_string, instance_name in mdns_results:
-                    try:
-                        node = await manager.connect_to_node(connection_string)
-                        nodes.append(node)
-                        port_map[node.id] = connection_string
-                        console.print(
-                            f"  [green]✓[/green] {connection_string} → [bold]{node.short_name}[/bold] "
-                            f"({node.hw_model})"
-                        )
-                    except Exception as e:
+
+                semaphore = asyncio.Semaphore(_MDNS_CONNECT_CONCURRENCY)
+
+                async def _connect(connection_string: str):
+                    async with semaphore:
+                        return await manager.connect_to_node(connection_string)
+
+                results = await asyncio.gather(
+                    *[_connect(connection_string) for connection_string, _ in mdns_results],
+                    return_exceptions=True,
+                )
+
+                for (connection_string, instance_name), result in zip(mdns_results, results, strict=True):
+                    if isinstance(result, Exception):
                         # Always show connection failures for mDNS discoveries
-                        error_msg = str(e)
+                        error_msg = str(result)
                         if len(error_msg) > 50:
                             error_msg = error_msg[:47] + "..."
                         console.print(f"  [red]✗[/red] {connection_string} → {error_msg}")
+                        continue
+
+                    nodes.append(result)
+                    port_map[result.id] = connection_string
+                    console.print(
+                        f"  [green]✓[/green] {connection_string} → [bold]{result.short_name}[/bold] "
+                        f"({result.hw_model})"
+                    )
 
         if not nodes:
             console.print("\n[yellow]No nodes discovered.[/yellow]")
@@ -710,15 +1136,13 @@ def discover(db: str, ports: tuple[str, ...], verbose: bool, network: bool):
 
         # Save to database with connections
         console.print("\nSaving to database...")
-        async with AsyncDatabase(db) as database:
-            await database.initialize()
-
-            for node in nodes:
-                # Save node data
-                await database.save_node(node)
-                # Save connection using the tracked port (this makes it "managed")
-                if node.id in port_map:
-                    await database.save_connection(node.id, port_map[node.id])
+        async with AsyncDatabase.acquire(db) as database:
+            async with database.batch() as batch:
+                for node in nodes:
+                    batch.upsert_node(node)
+                    # Save connection using the tracked port (this makes it "managed")
+                    if node.id in port_map:
+                        batch.save_connection(node.id, port_map[node.id])
 
         console.print(f"[green]Successfully discovered and saved {len(nodes)} connected node(s).[/green]")
         console.print("[dim]Run [bold]nodepool sync[/bold] to import heard nodes from the mesh.[/dim]")
@@ -752,26 +1176,24 @@ def discover(db: str, ports: tuple[str, ...], verbose: bool, network: bool):
 def list(db: str, show_all: bool, connected_only: bool, heard_only: bool):
     """List all nodes in the pool."""
     async def _list():
-        async with AsyncDatabase(db) as database:
+        from nodepool.database import AsyncDatabase
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
 
             # Get nodes based on filter
             if heard_only:
                 nodes = await database.get_heard_nodes()
                 node_ports = {}  # Heard nodes have no ports
-            elif connected_only or (not heard_only):
+            elif connected_only or not show_all:
                 # Default: show only connected nodes
                 connected = await database.get_connected_nodes()
                 nodes = [n for n, _ in connected]
                 node_ports = {n.id: p for n, p in connected}
             else:
-                nodes = await database.get_all_nodes(active_only=not show_all)
-                # Build port map for all nodes
-                node_ports = {}
-                for node in nodes:
-                    port = await database.get_connection(node.id)
-                    if port:
-                        node_ports[node.id] = port
+                rows = await database.get_nodes_with_connections(active_only=False)
+                nodes = [n for n, _ in rows]
+                node_ports = {n.id: c for n, c in rows if c}
 
         if not nodes:
             console.print("[yellow]No nodes found in database.[/yellow]")
@@ -801,15 +1223,14 @@ def list(db: str, show_all: bool, connected_only: bool, heard_only: bool):
 
         table.add_column("Status", style="white")
 
-        for node in nodes:
-            status = "✓ Active" if node.is_active else "✗ Inactive"
-            status_style = "green" if node.is_active else "red"
-
-            if heard_only:
-                # Show SNR and hops for heard nodes
-                snr_str = f"{node.snr:.1f}" if node.snr is not None else "?"
-                hops_str = str(node.hops_away) if node.hops_away is not None else "?"
+        # Styled cells are built once so rows skip markup parsing
+        active_cell = Text("✓ Active", style="green")
+        inactive_cell = Text("✗ Inactive", style="red")
 
+        if heard_only:
+            # Show SNR and hops for heard nodes
+            for node in nodes:
+                snr_str, hops_str = _format_signal(node)
                 table.add_row(
                     node.short_name,
                     node.id,
@@ -817,22 +1238,21 @@ def list(db: str, show_all: bool, connected_only: bool, heard_only: bool):
                     node.firmware_version or "Unknown",
                     snr_str,
                     hops_str,
-                    f"[{status_style}]{status}[/{status_style}]",
+                    active_cell if node.is_active else inactive_cell,
                 )
-            else:
-                # Show serial port for connected nodes
-                serial_port = node_ports.get(node.id, "Not connected")
+        else:
+            # Show serial port for connected nodes
+            for node in nodes:
                 table.add_row(
                     node.short_name,
                     node.id,
                     node.hw_model or "Unknown",
                     node.firmware_version or "Unknown",
-                    serial_port,
-                    f"[{status_style}]{status}[/{status_style}]",
+                    node_ports.get(node.id, "Not connected"),
+                    active_cell if node.is_active else inactive_cell,
                 )
 
-        console.print(table)
-        console.print(f"\nTotal: {len(nodes)} node(s)")
+        _print_once(table, f"\nTotal: {len(nodes)} node(s)")
 
     run_async(_list())
 
@@ -864,7 +1284,9 @@ def info(node_id: str, db: str, verbose: bool):
         node_id = f"!{node_id}"
     
     async def _info():
-        async with AsyncDatabase(db) as database:
+        from nodepool.database import AsyncDatabase
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
             node = await database.get_node(node_id)
             
@@ -874,229 +1296,30 @@ def info(node_id: str, db: str, verbose: bool):
             
             serial_port = await database.get_connection(node_id)
 
-        console.print(f"\n[bold cyan]Node Information: {node.short_name}[/bold cyan]")
-        console.print(f"[dim]{'=' * 60}[/dim]")
-
-        console.print("\n[bold]Basic Info:[/bold]")
-        console.print(f"  ID: {node.id}")
-        console.print(f"  Short Name: {node.short_name}")
-        console.print(f"  Long Name: {node.long_name}")
-        console.print(f"  Hardware: {node.hw_model or 'Unknown'}")
-        console.print(f"  Firmware: {node.firmware_version or 'Unknown'}")
-        console.print(f"  Connection: {serial_port or 'Not connected'}")
-        console.print(f"  Last Seen: {node.last_seen}")
-        console.print(f"  Status: {'Active' if node.is_active else 'Inactive'}")
+        lines = [
+            f"\n[bold cyan]Node Information: {node.short_name}[/bold cyan]",
+            f"[dim]{'=' * 60}[/dim]",
+            "\n[bold]Basic Info:[/bold]",
+            f"  ID: {node.id}",
+            f"  Short Name: {node.short_name}",
+            f"  Long Name: {node.long_name}",
+            f"  Hardware: {node.hw_model or 'Unknown'}",
+            f"  Firmware: {node.firmware_version or 'Unknown'}",
+            f"  Connection: {serial_port or 'Not connected'}",
+            f"  Last Seen: {node.last_seen}",
+            f"  Status: {'Active' if node.is_active else 'Inactive'}",
+        ]
 
         if node.config:
-            console.print("\n[bold]Configuration:[/bold]")
-            
-            # Helper function to format time ago
-            def time_ago(timestamp_str: str) -> str:
-                """Format timestamp as relative time."""
-                from datetime import datetime
-                try:
-                    retrieved = datetime.fromisoformat(timestamp_str)
-                    now = datetime.now()
-                    delta = now - retrieved
-                    if delta.total_seconds() < 60:
-                        return "just now"
-                    elif delta.total_seconds() < 3600:
-                        mins = int(delta.total_seconds() / 60)
-                        return f"{mins}m ago"
-                    elif delta.total_seconds() < 86400:
-                        hours = int(delta.total_seconds() / 3600)
-                        return f"{hours}h ago"
-                    else:
-                        days = int(delta.total_seconds() / 86400)
-                        return f"{days}d ago"
-                except:
-                    return timestamp_str
-            
-            # Display each config section with metadata if available
-            config_sections_displayed = []
-            
-            # LoRa config
-            if "lora" in node.config:
-                lora = node.config["lora"]
-                # Check if this is new format with metadata
-                if isinstance(lora, dict) and "_status" in lora:
-                    if lora["_status"] == "loaded":
-                        timestamp = time_ago(lora.get("_retrieved_at", ""))
-                        console.print(f"  LoRa [dim]({timestamp})[/dim]:")
-                        for key, value in lora.items():
-                            if not key.startswith("_"):  # Skip metadata fields
-                                console.print(f"    {key}: {value}")
-                        config_sections_displayed.append("lora")
-                else:
-                    # Old format without metadata
-                    console.print("  LoRa:")
-                    console.print(f"    Hop Limit: {lora.get('hopLimit', 'Not set')}")
-                    console.print(f"    Region: {lora.get('region', 'Not set')}")
-                    config_sections_displayed.append("lora")
-
-            # Device config
-            if "device" in node.config:
-                device = node.config["device"]
-                if isinstance(device, dict) and "_status" in device:
-                    if device["_status"] == "loaded":
-                        timestamp = time_ago(device.get("_retrieved_at", ""))
-                        console.print(f"  Device [dim]({timestamp})[/dim]:")
-                        for key, value in device.items():
-                            if not key.startswith("_"):
-                                console.print(f"    {key}: {value}")
-                        config_sections_displayed.append("device")
-                else:
-                    console.print("  Device:")
-                    console.print(f"    Role: {device.get('role', 'Not set')}")
-                    config_sections_displayed.append("device")
-
-            if "security" in node.config:
-                import base64
-                security = node.config["security"]
-                console.print("  Security:")
-                
-                # Display admin keys (up to 3 slots)
-                admin_keys = security.get('admin_keys', [])
-                admin_keys_set = security.get('admin_keys_set', [])
-                if admin_keys:
-                    console.print(f"    Admin Keys: {len(admin_keys)} set")
-                    for i, key_hex in enumerate(admin_keys):
-                        slot = admin_keys_set[i] if i < len(admin_keys_set) else i
-                        # Convert hex to base64 for display (matches Meshtastic app format)
-                        key_bytes = bytes.fromhex(key_hex)
-                        key_b64 = base64.b64encode(key_bytes).decode('ascii')
-                        console.print(f"      [{slot}] {key_b64}")
-                else:
-                    console.print("    Admin Keys: None set")
-                
-                # Display PKI keys
-                if security.get('public_key'):
-                    pub_key_hex = security['public_key']
-                    # Convert to base64 for display
-                    pub_key_bytes = bytes.fromhex(pub_key_hex)
-                    pub_key_b64 = base64.b64encode(pub_key_bytes).decode('ascii')
-                    console.print(f"    Public Key: {pub_key_b64}")
-                if security.get('private_key'):
-                    console.print(f"    Private Key: XXXXX--PRIVATE-KEY--XXXXX (hidden)")
-                
-                console.print(f"    Serial Enabled: {security.get('serial_enabled', 'Unknown')}")
-                console.print(f"    Admin Channel Enabled: {security.get('admin_channel_enabled', False)}")
-                console.print(f"    Managed: {security.get('is_managed', False)}")
-
-            if node.config.get("channels"):
-                console.print("  Channels:")
-                for channel in node.config["channels"]:
-                    psk = channel.get('psk')
-                    psk_info = f" [PSK: {psk[:8]}...]" if psk else " [Not encrypted]"
-                    console.print(
-                        f"    [{channel.get('index', '?')}] {channel.get('name', 'Unnamed')}{psk_info}"
-                    )
-            
-            # Position config
-            if "position" in node.config:
-                pos = node.config["position"]
-                console.print("  Position:")
-                if pos.get("position_broadcast_secs"):
-                    interval_min = pos["position_broadcast_secs"] // 60
-                    console.print(f"    Broadcast: {pos['position_broadcast_secs']}s ({interval_min} min)")
-                console.print(f"    Smart Mode: {pos.get('position_broadcast_smart_enabled', False)}")
-                console.print(f"    GPS Enabled: {pos.get('gps_enabled', True)}")
-                console.print(f"    Fixed Position: {pos.get('fixed_position', False)}")
-            
-            # Module configs (only show enabled or configured modules)
-            console.print("\n[bold]Modules:[/bold]")
-            
-            # MQTT
-            if "mqtt" in node.config:
-                mqtt = node.config["mqtt"]
-                if mqtt.get("enabled"):
-                    console.print("  [cyan]MQTT:[/cyan]")
-                    console.print(f"    Enabled: {mqtt['enabled']}")
-                    if mqtt.get("address"):
-                        console.print(f"    Address: {mqtt['address']}")
-                    console.print(f"    Map Reporting: {mqtt.get('map_reporting_enabled', False)} {'[green](OK to MQTT)[/green]' if mqtt.get('map_reporting_enabled') else '[dim](IGNORE MQTT)[/dim]'}")
-                    console.print(f"    JSON: {mqtt.get('json_enabled', False)}")
-                    console.print(f"    TLS: {mqtt.get('tls_enabled', False)}")
-            
-            # Telemetry
-            if "telemetry" in node.config:
-                telem = node.config["telemetry"]
-                if telem.get("device_update_interval") or telem.get("environment_measurement_enabled"):
-                    console.print("  [cyan]Telemetry:[/cyan]")
-                    if telem.get("device_update_interval"):
-                        console.print(f"    Device Interval: {telem['device_update_interval']}s")
-                    if telem.get("environment_update_interval"):
-                        console.print(f"    Environment Interval: {telem['environment_update_interval']}s")
-                    console.print(f"    Environment: {telem.get('environment_measurement_enabled', False)}")
-                    console.print(f"    Display °F: {telem.get('environment_display_fahrenheit', False)}")
-            
-            # Store & Forward
-            if "store_forward" in node.config:
-                sf = node.config["store_forward"]
-                if sf.get("enabled"):
-                    console.print("  [cyan]Store & Forward:[/cyan]")
-                    console.print(f"    Enabled: {sf['enabled']}")
-                    console.print(f"    Records: {sf.get('records', 0)}")
-                    console.print(f"    Heartbeat: {sf.get('heartbeat', False)}")
-            
-            # Range Test
-            if "range_test" in node.config:
-                rt = node.config["range_test"]
-                if rt.get("enabled"):
-                    console.print("  [cyan]Range Test:[/cyan]")
-                    console.print(f"    Enabled: {rt['enabled']}")
-                    console.print(f"    Sender: {rt.get('sender', 0)}")
-                    console.print(f"    Save: {rt.get('save', False)}")
-            
-            # External Notification
-            if "external_notification" in node.config:
-                en = node.config["external_notification"]
-                if en.get("enabled"):
-                    console.print("  [cyan]External Notification:[/cyan]")
-                    console.print(f"    Enabled: {en['enabled']}")
-                    console.print(f"    Alert on Message: {en.get('alert_message', False)}")
-                    console.print(f"    Alert on Bell: {en.get('alert_bell', False)}")
-            
-            # Serial Module
-            if "serial_module" in node.config:
-                ser = node.config["serial_module"]
-                if ser.get("enabled"):
-                    console.print("  [cyan]Serial Module:[/cyan]")
-                    console.print(f"    Enabled: {ser['enabled']}")
-                    console.print(f"    Baud: {ser.get('baud', 0)}")
-                    console.print(f"    Echo: {ser.get('echo', False)}")
-            
-            # Neighbor Info
-            if "neighbor_info" in node.config:
-                ni = node.config["neighbor_info"]
-                if ni.get("enabled"):
-                    console.print("  [cyan]Neighbor Info:[/cyan]")
-                    console.print(f"    Enabled: {ni['enabled']}")
-                    console.print(f"    Update Interval: {ni.get('update_interval', 0)}s")
-            
-            # Detection Sensor
-            if "detection_sensor" in node.config:
-                ds = node.config["detection_sensor"]
-                if ds.get("enabled"):
-                    console.print("  [cyan]Detection Sensor:[/cyan]")
-                    console.print(f"    Enabled: {ds['enabled']}")
-                    console.print(f"    Monitor Pin: {ds.get('monitor_pin', 0)}")
-            
-            # Paxcounter
-            if "paxcounter" in node.config:
-                pc = node.config["paxcounter"]
-                if pc.get("enabled"):
-                    console.print("  [cyan]Paxcounter:[/cyan]")
-                    console.print(f"    Enabled: {pc['enabled']}")
-                    console.print(f"    Update Interval: {pc.get('paxcounter_update_interval', 0)}s")
-        
-        # Show full config JSON if verbose flag is set
-        if verbose and node.config:
-            import json
-            console.print("\n[bold]Full Configuration (JSON):[/bold]")
-            console.print(json.dumps(node.config, indent=2))
+            lines.extend(_config_lines(node.config))
 
-        console.print()
+            # Show full config JSON if verbose flag is set
+            if verbose:
+                lines.append("\n[bold]Full Configuration (JSON):[/bold]")
+                lines.append(json.dumps(node.config, indent=2))
+
+        lines.append("")
+        _print_once("\n".join(lines))
 
     run_async(_info())
 
@@ -1121,55 +1344,54 @@ def info(node_id: str, db: str, verbose: bool):
 def check(db: str, ttl: int, region: str | None):
     """Run configuration checks on managed nodes."""
     async def _check():
-        async with AsyncDatabase(db) as database:
+        from nodepool.config_checker import ConfigChecker
+        from nodepool.database import AsyncDatabase
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
             # Only check managed nodes (those with connections)
-            connected_nodes = await database.get_connected_nodes()
-            nodes = [n for n, _ in connected_nodes]
-
-        if not nodes:
-            console.print("[yellow]No managed nodes found in database.[/yellow]")
-            console.print("Run [bold]nodepool discover[/bold] to add managed nodes.")
-            return
-
-        console.print(f"[bold blue]Running configuration checks on {len(nodes)} managed node(s)...[/bold blue]\n")
-
-        checker = ConfigChecker(expected_ttl=ttl, expected_region=region)
-        all_checks = await checker.check_all_nodes(nodes)
-
-        # Save checks to database
-        async with AsyncDatabase(db) as database:
-            for check in all_checks:
-                await database.save_config_check(check)
-
-        # Display results by node
-        for node in nodes:
-            node_checks = [c for c in all_checks if c.node_id == node.id]
+            nodes = await database.get_all_nodes(managed=True)
 
-            console.print(f"[bold]{node.short_name}[/bold] ({node.id})")
+            if not nodes:
+                console.print("[yellow]No managed nodes found in database.[/yellow]")
+                console.print("Run [bold]nodepool discover[/bold] to add managed nodes.")
+                return
 
-            for check in node_checks:
-                icon = ""
-                style = ""
-                match check.status:
-                    case "pass":
-                        icon = "✓"
-                        style = "green"
-                    case "fail":
-                        icon = "✗"
-                        style = "red"
-                    case "warning":
-                        icon = "⚠"
-                        style = "yellow"
+            console.print(f"[bold blue]Running configuration checks on {len(nodes)} managed node(s)...[/bold blue]\n")
 
-                console.print(f"  [{style}]{icon}[/{style}] {check.message}")
+            checker = ConfigChecker(expected_ttl=ttl, expected_region=region)
+            counts = Counter()
 
-            console.print()
+            # Check one node at a time, printing each node's results as soon as
+            # they are produced; the results are saved in one transaction
+            async with database.batch() as batch:
+                for node in nodes:
+                    lines = [f"[bold]{node.short_name}[/bold] ({node.id})"]
+
+                    for check in checker.check_node(node):
+                        batch.insert_config_check(check)
+                        counts[check.status] += 1
+
+                        icon = ""
+                        style = ""
+                        match check.status:
+                            case "pass":
+                                icon = "✓"
+                                style = "green"
+                            case "fail":
+                                icon = "✗"
+                                style = "red"
+                            case "warning":
+                                icon = "⚠"
+                                style = "yellow"
+
+                        lines.append(f"  [{style}]{icon}[/{style}] {check.message}")
+
+                    lines.append("")
+                    console.print("\n".join(lines))
 
         # Summary
-        pass_count = sum(1 for c in all_checks if c.status == "pass")
-        fail_count = sum(1 for c in all_checks if c.status == "fail")
-        warn_count = sum(1 for c in all_checks if c.status == "warning")
+        pass_count, fail_count, warn_count = counts["pass"], counts["fail"], counts["warning"]
 
         console.print("[bold]Summary:[/bold]")
         console.print(f"  [green]✓ Passed: {pass_count}[/green]")
@@ -1186,10 +1408,19 @@ def check(db: str, ttl: int, region: str | None):
     help="Database file path",
     type=click.Path(),
 )
-def status(db: str):
+@click.option(
+    "--concurrency",
+    default=8,
+    help="Maximum number of nodes to probe at once",
+    type=click.IntRange(min=1),
+)
+def status(db: str, concurrency: int):
     """Check reachability status of connected nodes."""
     async def _status():
-        async with AsyncDatabase(db) as database:
+        from nodepool.database import AsyncDatabase
+        from nodepool.node_manager import NodeManager
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
             connected_nodes = await database.get_connected_nodes()
 
@@ -1201,12 +1432,11 @@ def status(db: str):
         console.print(f"[bold blue]Checking status of {len(connected_nodes)} connected node(s)...[/bold blue]\n")
 
         manager = NodeManager()
-        statuses = []
-        
+        nodes = [node for node, _ in connected_nodes]
+        connections = {node.id: serial_port for node, serial_port in connected_nodes}
+
         with console.status("[bold green]Checking node reachability..."):
-            for node, serial_port in connected_nodes:
-                status = await manager.check_node_reachability(node, serial_port)
-                statuses.append((status, serial_port))
+            statuses = await manager.check_all_reachability(nodes, connections, concurrency)
 
         table = Table(title="Node Status")
         table.add_column("Node", style="cyan", no_wrap=True)
@@ -1214,20 +1444,20 @@ def status(db: str):
         table.add_column("Status", style="white")
         table.add_column("Error", style="red")
 
-        for status, connection_string in statuses:
-            reachable_text = "✓ Reachable" if status.reachable else "✗ Unreachable"
-            reachable_style = "green" if status.reachable else "red"
+        reachable_cell = Text("✓ Reachable", style="green")
+        unreachable_cell = Text("✗ Unreachable", style="red")
 
+        reachable_count = 0
+        for status in statuses:
+            reachable_count += status.reachable
             table.add_row(
                 f"{status.node.short_name} ({status.node.id})",
-                connection_string,
-                f"[{reachable_style}]{reachable_text}[/{reachable_style}]",
+                connections[status.node.id],
+                reachable_cell if status.reachable else unreachable_cell,
                 status.error or "",
             )
 
         console.print(table)
-
-        reachable_count = sum(1 for s, _ in statuses if s.reachable)
         console.print(f"\n{reachable_count}/{len(statuses)} node(s) reachable")
 
     run_async(_status())
@@ -1244,26 +1474,31 @@ def status(db: str):
     "--port",
     help="Specific serial port to sync from",
 )
-def sync(db: str, port: str | None):
+@click.option(
+    "--concurrency",
+    default=8,
+    help="Maximum number of managed nodes to read from at once",
+    type=click.IntRange(min=1),
+)
+def sync(db: str, port: str | None, concurrency: int):
     """Sync heard nodes from connected managed node(s)."""
     async def _sync():
-        async with AsyncDatabase(db) as database:
+        from nodepool.database import AsyncDatabase
+        from nodepool.node_manager import NodeManager
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
 
-            # Get connected nodes (managed via connections table)
-            connected_nodes = await database.get_connected_nodes()
+            # Get connected nodes (managed via connections table), filtered by port if specified
+            connected_nodes = await database.get_connected_nodes(port)
 
             if not connected_nodes:
-                console.print("[yellow]No connected nodes found.[/yellow]")
-                console.print("Run [bold]nodepool discover[/bold] first.")
-                return
-
-            # Filter by port if specified
-            if port:
-                connected_nodes = [(n, p) for n, p in connected_nodes if p == port]
-                if not connected_nodes:
+                if port:
                     console.print(f"[red]No connected node found on port {port}[/red]")
-                    return
+                else:
+                    console.print("[yellow]No connected nodes found.[/yellow]")
+                    console.print("Run [bold]nodepool discover[/bold] first.")
+                return
 
             console.print(f"[bold blue]Syncing heard nodes from {len(connected_nodes)} connected node(s)...[/bold blue]\n")
 
@@ -1272,54 +1507,75 @@ def sync(db: str, port: str | None):
             total_new = 0
             total_updated = 0
 
-            for node, serial_port in connected_nodes:
-                console.print(f"Syncing from {node.short_name} ({serial_port})...")
-                try:
-                    # First, refresh the managed node's config
-                    refreshed_node = await manager.connect_to_node(serial_port)
-                    await database.save_node(refreshed_node)
-                    console.print(f"  [dim]→ Refreshed config for {node.short_name}[/dim]")
-                    
-                    # Then import heard nodes
-                    heard_nodes, heard_history = await manager.import_heard_nodes(
-                        serial_port, node.id
-                    )
+            semaphore = asyncio.Semaphore(concurrency)
 
-                    # Track new vs updated nodes
-                    new_nodes = []
-                    updated_nodes = []
+            async def _fetch(node: Node, serial_port: str):
+                # Refresh the managed node's config, then import heard nodes.
+                # A failed heard import is returned rather than raised so the
+                # refreshed config is still saved.
+                async with semaphore:
+                    refreshed_node = await manager.connect_to_node(serial_port)
+                    try:
+                        heard = await manager.import_heard_nodes(serial_port, node.id)
+                    except Exception as e:
+                        heard = e
+                return refreshed_node, heard
+
+            # Each managed node is a separate device, so read them concurrently
+            with console.status("[bold green]Reading from connected node(s)..."):
+                results = await asyncio.gather(
+                    *[_fetch(node, serial_port) for node, serial_port in connected_nodes],
+                    return_exceptions=True,
+                )
 
-                    # Check which nodes are new
-                    for heard_node in heard_nodes:
-                        existing = await database.get_node(heard_node.id)
-                        if existing is None:
-                            new_nodes.append(heard_node)
-                        else:
-                            updated_nodes.append(heard_node)
+            for (node, serial_port), result in zip(connected_nodes, results, strict=True):
+                # Collect this managed node's report and print it in one write
+                lines = [f"Syncing from {node.short_name} ({serial_port})..."]
+                if isinstance(result, Exception):
+                    lines.append(f"  [red]✗[/red] Error: {result}")
+                    console.print("\n".join(lines))
+                    continue
 
-                        # Save the node (insert or update)
-                        await database.save_node(heard_node)
+                refreshed_node, heard = result
+                heard_nodes, heard_history = ([], []) if isinstance(heard, Exception) else heard
 
-                    # Save heard history
-                    for history in heard_history:
-                        await database.save_heard_history(history)
+                try:
+                    # Save nodes (insert or update) and heard history in one transaction;
+                    # the batch reports which nodes were new. Neighbours heard by an
+                    # earlier managed node are already saved, so count as updated.
+                    async with database.batch() as batch:
+                        batch.upsert_node(refreshed_node)
+                        for heard_node in heard_nodes:
+                            batch.upsert_node(heard_node)
+                        for history in heard_history:
+                            batch.insert_history(history)
+                    lines.append(f"  [dim]→ Refreshed config for {node.short_name}[/dim]")
+
+                    if isinstance(heard, Exception):
+                        raise heard
+
+                    new_nodes, updated_nodes = _split_new_nodes(heard_nodes, batch.new_node_ids)
 
                     total_heard += len(heard_nodes)
                     total_new += len(new_nodes)
                     total_updated += len(updated_nodes)
 
                     # Display results for this managed node
-                    console.print(f"  [green]✓[/green] Imported {len(heard_nodes)} heard node(s)")
+                    lines.append(f"  [green]✓[/green] Imported {len(heard_nodes)} heard node(s)")
                     if new_nodes:
-                        new_names = ", ".join(n.short_name for n in new_nodes[:5])
-                        if len(new_nodes) > 5:
-                            new_names += f", ... (+{len(new_nodes) - 5} more)"
-                        console.print(f"    - {len(new_nodes)} new: {new_names}")
+                        head = new_nodes[:5]
+                        more = len(new_nodes) - len(head)
+                        suffix = f", ... (+{more} more)" if more else ""
+                        lines.append(
+                            f"    - {len(new_nodes)} new: "
+                            f"{', '.join(n.short_name for n in head)}{suffix}"
+                        )
                     if updated_nodes:
-                        console.print(f"    - {len(updated_nodes)} updated")
-
+                        lines.append(f"    - {len(updated_nodes)} updated")
                 except Exception as e:
-                    console.print(f"  [red]✗[/red] Error: {e}")
+                    lines.append(f"  [red]✗[/red] Error: {e}")
+
+                console.print("\n".join(lines))
 
             # Summary
             console.print(f"\n[green]Successfully synced {total_heard} total heard node(s)[/green]")
@@ -1345,7 +1601,9 @@ def sync(db: str, port: str | None):
 def heard(db: str, seen_by: str | None):
     """List nodes heard on the mesh network."""
     async def _heard():
-        async with AsyncDatabase(db) as database:
+        from nodepool.database import AsyncDatabase
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
             nodes = await database.get_heard_nodes(seen_by=seen_by)
 
@@ -1364,8 +1622,7 @@ def heard(db: str, seen_by: str | None):
         table.add_column("Last Seen", style="white")
 
         for node in nodes:
-            snr_str = f"{node.snr:.1f}" if node.snr is not None else "?"
-            hops_str = str(node.hops_away) if node.hops_away is not None else "?"
+            snr_str, hops_str = _format_signal(node)
 
             table.add_row(
                 node.short_name,
@@ -1374,7 +1631,8 @@ def heard(db: str, seen_by: str | None):
                 node.hw_model or "Unknown",
                 snr_str,
                 hops_str,
-                node.last_seen.strftime("%Y-%m-%d %H:%M"),
+                # "YYYY-MM-DD HH:MM"; the slice drops any UTC offset
+                node.last_seen.isoformat(sep=" ", timespec="minutes")[:16],
             )
 
         console.print(table)
@@ -1406,48 +1664,57 @@ def heard(db: str, seen_by: str | None):
 def export(db: str, output: str | None, output_format: str):
     """Export node configurations."""
     async def _export():
-        import json
+        from nodepool.database import AsyncDatabase
 
-        async with AsyncDatabase(db) as database:
+        # Check for the optional YAML dependency before reading the database
+        if output_format == "yaml":
+            try:
+                import yaml
+            except ImportError:
+                console.print("[red]YAML export requires PyYAML. Install with: uv pip install pyyaml[/red]")
+                return
+
+            # Records hold only plain data, so the safe dumper suffices; prefer
+            # the libyaml-backed one when PyYAML was built with it
+            yaml_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+        async with AsyncDatabase.acquire(db) as database:
             await database.initialize()
-            nodes = await database.get_all_nodes(active_only=False)
-            
-            # Build export data with connection info
-            nodes_data = []
-            for node in nodes:
-                connection_string = await database.get_connection(node.id)
-                nodes_data.append({
-                    "id": node.id,
-                    "short_name": node.short_name,
-                    "long_name": node.long_name,
-                    "connection_string": connection_string,
-                    "hw_model": node.hw_model,
-                    "firmware_version": node.firmware_version,
-                    "last_seen": node.last_seen.isoformat(),
-                    "is_active": node.is_active,
-                    "config": node.config,
-                })
+            # Nodes and their connection info in one query
+            rows = await database.get_nodes_with_connections(active_only=False)
 
-        if not nodes:
+        if not rows:
             console.print("[yellow]No nodes found in database.[/yellow]")
             return
 
+        # Records are built lazily while writing
+        records = (_export_record(node, connection_string) for node, connection_string in rows)
+
+        # Serialize straight into the output stream rather than one big string
         if output_format == "json":
-            output_str = json.dumps(nodes_data, indent=2)
+            def write(stream: TextIO) -> None:
+                stream.writelines(_iter_json_array(records, _get_json_dumps()))
         else:  # yaml
-            try:
-                import yaml
-
-                output_str = yaml.dump(nodes_data, default_flow_style=False)
-            except ImportError:
-                console.print("[red]YAML export requires PyYAML. Install with: uv pip install pyyaml[/red]")
-                return
+            def write(stream: TextIO) -> None:
+                # The YAML document is a single list, so the emitter needs it up front
+                yaml.dump(
+                    [*records],
+                    stream,
+                    Dumper=yaml_dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
 
         if output:
-            Path(output).write_text(output_str)
-            console.print(f"[green]Exported {len(nodes)} node(s) to {output}[/green]")
+            # Serialize and write off the event loop thread
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _write_export, Path(output), write)
+            console.print(f"[green]Exported {len(rows)} node(s) to {output}[/green]")
         else:
-            console.print(output_str)
+            stdout = click.get_text_stream("stdout")
+            write(stdout)
+            stdout.write("\n")
+            stdout.flush()
 
     run_async(_export())
 
@@ -1470,66 +1737,110 @@ def export(db: str, output: str | None, output_format: str):
     default="https://meshview.bayme.sh",
     help="MeshView API base URL",
 )
-def sync_meshview(db: str, days_active: int, url: str):
-    """Sync nodes from MeshView API."""
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Ignore MeshView data cached by a recent run",
+)
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Show the full traceback on failure",
+)
+def sync_meshview(db: str, days_active: int, url: str, refresh: bool, verbose: bool):
+    """Sync nodes from MeshView API.
+
+    Responses are cached for a few minutes so repeated runs don't refetch
+    the full node list; use --refresh to force a new request.
+    """
     async def _sync_meshview():
+        from nodepool.database import AsyncDatabase
+        from nodepool.meshview_api import CACHE_TTL, MeshViewAPIClient, default_cache_dir
+
         console.print(f"[bold blue]Fetching nodes from MeshView API...[/bold blue]")
         console.print(f"URL: {url}/api/nodes?days_active={days_active}\n")
 
-        try:
-            # Fetch nodes from API
-            client = MeshViewAPIClient(base_url=url)
-            with console.status("[bold green]Fetching data from API..."):
-                nodes, heard_history = await client.fetch_nodes(days_active=days_active)
-
-            if not nodes:
-                console.print("[yellow]No nodes found from MeshView API.[/yellow]")
-                return
+        total = 0
+        new_nodes = []
+        updated_nodes = []
 
-            console.print(f"[green]Fetched {len(nodes)} node(s) from API[/green]\n")
+        try:
+            client = MeshViewAPIClient(
+                base_url=url,
+                cache_dir=default_cache_dir(),
+                cache_ttl=0 if refresh else CACHE_TTL,
+            )
 
-            # Save to database
-            console.print("Saving to database...")
-            async with AsyncDatabase(db) as database:
+            async with AsyncDatabase.acquire(db) as database:
                 await database.initialize()
 
-                # Track new vs updated nodes
-                new_nodes = []
-                updated_nodes = []
+                async def _save_page(nodes, heard_history):
+                    # Save the page's nodes and heard history in one transaction
+                    async with database.batch() as batch:
+                        for node in nodes:
+                            batch.upsert_node(node)
+                        for history in heard_history:
+                            batch.insert_history(history)
 
-                for node in nodes:
-                    existing = await database.get_node(node.id)
-                    if existing is None:
-                        new_nodes.append(node)
-                    else:
-                        updated_nodes.append(node)
-
-                    # Save the node
-                    await database.save_node(node)
+                    # Track new vs updated nodes
+                    page_new, page_updated = _split_new_nodes(nodes, batch.new_node_ids)
+                    new_nodes.extend(page_new)
+                    updated_nodes.extend(page_updated)
 
-                # Save heard history
-                for history in heard_history:
-                    await database.save_heard_history(history)
+                # Save each page in the background while the next one is parsed
+                pending = None
+                with console.status("[bold green]Fetching data from API..."):
+                    try:
+                        async for nodes, heard_history in client.fetch_node_pages(
+                            days_active=days_active
+                        ):
+                            if pending:
+                                await pending
+                            console.print(
+                                f"[green]Fetched {len(nodes)} node(s) from API[/green], "
+                                "saving to database..."
+                            )
+                            pending = asyncio.create_task(_save_page(nodes, heard_history))
+                            total += len(nodes)
+                    except Exception:
+                        # Let the last save finish, but report the fetch error
+                        # rather than anything the save raises
+                        if pending:
+                            with contextlib.suppress(Exception):
+                                await pending
+                        raise
+                    if pending:
+                        await pending
+
+            if not total:
+                console.print("[yellow]No nodes found from MeshView API.[/yellow]")
+                return
 
             # Display summary
-            console.print(f"[green]Successfully synced {len(nodes)} node(s) from MeshView API[/green]")
+            lines = [f"[green]Successfully synced {total} node(s) from MeshView API[/green]"]
             if new_nodes:
-                console.print(f"  [cyan]→ {len(new_nodes)} new node(s)[/cyan]")
+                lines.append(f"  [cyan]→ {len(new_nodes)} new node(s)[/cyan]")
                 # Show sample of new nodes
-                sample = new_nodes[:5]
-                for node in sample:
-                    console.print(f"    - {node.short_name} ({node.id})")
-                if len(new_nodes) > 5:
-                    console.print(f"    ... and {len(new_nodes) - 5} more")
+                head = new_nodes[:5]
+                lines.extend(f"    - {node.short_name} ({node.id})" for node in head)
+                if more := len(new_nodes) - len(head):
+                    lines.append(f"    ... and {more} more")
             if updated_nodes:
-                console.print(f"  [dim]→ {len(updated_nodes)} updated node(s)[/dim]")
+                lines.append(f"  [dim]→ {len(updated_nodes)} updated node(s)[/dim]")
+            console.print("\n".join(lines))
 
             console.print("\n[dim]Note: All nodes from MeshView are marked as heard from 'meshviewAPI'[/dim]")
 
         except Exception as e:
-            console.print(f"[red]Error fetching from MeshView API: {e}[/red]")
-            import traceback
-            console.print(f"[dim]{traceback.format_exc()}[/dim]")
+            console.print(f"[red]Error fetching from MeshView API: {type(e).__name__}: {e}[/red]")
+            if verbose:
+                console.print(f"[dim]{traceback.format_exc()}[/dim]")
+            if saved := len(new_nodes) + len(updated_nodes):
+                console.print(
+                    f"[yellow]{saved} node(s) from earlier pages were saved "
+                    f"({len(new_nodes)} new, {len(updated_nodes)} updated)[/yellow]"
+                )
 
     run_async(_sync_meshview())
 
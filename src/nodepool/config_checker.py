@@ -1,9 +1,19 @@
 """Configuration validation logic for nodes."""
 
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from types import MappingProxyType
 from typing import Any
 
 from nodepool.models import ConfigCheck, Node
 
+# Shared read-only stand-in for a missing config section, so lookups on
+# nodes without one don't allocate a new dict each time
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
+# Hex admin keys treated as default/weak: the one-byte defaults
+# (AQ== in base64 is 0x01) and an all-zero 32-byte key
+_WEAK_ADMIN_KEYS: frozenset[str] = frozenset({"00", "01", "00" * 32})
+
 
 class ConfigChecker:
     """Validates node configurations against expected values."""
@@ -25,7 +35,13 @@ class ConfigChecker:
         self.expected_region = expected_region
         self.expected_channels = expected_channels or []
 
-    async def check_ttl(self, node: Node) -> ConfigCheck:
+        # Messages that only depend on the expected values are rendered once
+        self._ttl_missing_message = f"TTL not configured (expected: {expected_ttl})"
+        self._ttl_pass_message = f"TTL correctly set to {expected_ttl}"
+        self._region_missing_message = f"Region not configured (expected: {expected_region})"
+        self._region_pass_message = f"Region correctly set to {expected_region}"
+
+    def check_ttl(self, node: Node) -> ConfigCheck:
         """Check if node has correct TTL/hop limit.
 
         Args:
@@ -34,30 +50,42 @@ class ConfigChecker:
         Returns:
             ConfigCheck result
         """
-        actual_ttl = node.config.get("lora", {}).get("hopLimit")
+        return self._check_ttl(node.id, node.config.get("lora") or _EMPTY_SECTION)
+
+    def _check_ttl(self, node_id: str, lora: Mapping[str, Any]) -> ConfigCheck:
+        """Check if node has correct TTL/hop limit.
+
+        Args:
+            node_id: ID of the node being checked
+            lora: LoRa config section
+
+        Returns:
+            ConfigCheck result
+        """
+        actual_ttl = lora.get("hopLimit")
 
         if actual_ttl is None:
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="ttl",
                 expected_value=self.expected_ttl,
                 actual_value=None,
                 status="warning",
-                message=f"TTL not configured (expected: {self.expected_ttl})",
+                message=self._ttl_missing_message,
             )
 
         if actual_ttl == self.expected_ttl:
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="ttl",
                 expected_value=self.expected_ttl,
                 actual_value=actual_ttl,
                 status="pass",
-                message=f"TTL correctly set to {self.expected_ttl}",
+                message=self._ttl_pass_message,
             )
 
         return ConfigCheck(
-            node_id=node.id,
+            node_id=node_id,
             check_type="ttl",
             expected_value=self.expected_ttl,
             actual_value=actual_ttl,
@@ -65,18 +93,30 @@ class ConfigChecker:
             message=f"TTL mismatch: expected {self.expected_ttl}, got {actual_ttl}",
         )
 
-    async def check_region(self, node: Node) -> ConfigCheck:
+    def check_region(self, node: Node) -> ConfigCheck:
         """Check if node has correct LoRa region.
 
         Args:
             node: Node to check
 
+        Returns:
+            ConfigCheck result
+        """
+        return self._check_region(node.id, node.config.get("lora") or _EMPTY_SECTION)
+
+    def _check_region(self, node_id: str, lora: Mapping[str, Any]) -> ConfigCheck:
+        """Check if node has correct LoRa region.
+
+        Args:
+            node_id: ID of the node being checked
+            lora: LoRa config section
+
         Returns:
             ConfigCheck result
         """
         if not self.expected_region:
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="region",
                 expected_value=None,
                 actual_value=None,
@@ -84,30 +124,30 @@ class ConfigChecker:
                 message="Region check skipped (no expected region configured)",
             )
 
-        actual_region = node.config.get("lora", {}).get("region")
+        actual_region = lora.get("region")
 
         if actual_region is None:
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="region",
                 expected_value=self.expected_region,
                 actual_value=None,
                 status="warning",
-                message=f"Region not configured (expected: {self.expected_region})",
+                message=self._region_missing_message,
             )
 
         if actual_region == self.expected_region:
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="region",
                 expected_value=self.expected_region,
                 actual_value=actual_region,
                 status="pass",
-                message=f"Region correctly set to {self.expected_region}",
+                message=self._region_pass_message,
             )
 
         return ConfigCheck(
-            node_id=node.id,
+            node_id=node_id,
             check_type="region",
             expected_value=self.expected_region,
             actual_value=actual_region,
@@ -115,19 +155,34 @@ class ConfigChecker:
             message=f"Region mismatch: expected {self.expected_region}, got {actual_region}",
         )
 
-    async def check_channel(self, node: Node, channel_index: int = 1) -> ConfigCheck:
+    def check_channel(self, node: Node, channel_index: int = 1) -> ConfigCheck:
         """Check if node has correct secondary channel configuration.
 
         Args:
             node: Node to check
             channel_index: Channel index to check (default: 1 for secondary)
 
+        Returns:
+            ConfigCheck result
+        """
+        return self._check_channel(node.id, node.config.get("channels") or (), channel_index)
+
+    def _check_channel(
+        self, node_id: str, channels: Sequence[dict[str, Any]], channel_index: int
+    ) -> ConfigCheck:
+        """Check if node has correct secondary channel configuration.
+
+        Args:
+            node_id: ID of the node being checked
+            channels: Channel configurations
+            channel_index: Channel index to check
+
         Returns:
             ConfigCheck result
         """
         if not self.expected_channels:
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="channel",
                 expected_value=None,
                 actual_value=None,
@@ -135,11 +190,9 @@ class ConfigChecker:
                 message="Channel check skipped (no expected channels configured)",
             )
 
-        channels = node.config.get("channels", [])
-
         if channel_index >= len(channels):
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="channel",
                 expected_value=f"Channel {channel_index}",
                 actual_value=None,
@@ -151,7 +204,7 @@ class ConfigChecker:
 
         # For simplicity, just check if channel exists
         return ConfigCheck(
-            node_id=node.id,
+            node_id=node_id,
             check_type="channel",
             expected_value=f"Channel {channel_index} present",
             actual_value=actual_channel.get("name", f"Channel {channel_index}"),
@@ -159,7 +212,7 @@ class ConfigChecker:
             message=f"Channel {channel_index} is configured",
         )
 
-    async def check_node(self, node: Node) -> list[ConfigCheck]:
+    def check_node(self, node: Node) -> list[ConfigCheck]:
         """Run all configuration checks on a node.
 
         Args:
@@ -168,32 +221,36 @@ class ConfigChecker:
         Returns:
             List of ConfigCheck results
         """
-        checks = []
+        # Look up each config section once and share it between the checks
+        node_id = node.id
+        lora = node.config.get("lora") or _EMPTY_SECTION
+        security = node.config.get("security")
+        channels = node.config.get("channels")
 
         # Check TTL
-        checks.append(await self.check_ttl(node))
+        checks = [self._check_ttl(node_id, lora)]
 
         # Check region if configured
         if self.expected_region:
-            checks.append(await self.check_region(node))
+            checks.append(self._check_region(node_id, lora))
 
         # Check channels if configured
         if self.expected_channels:
             for i in range(len(self.expected_channels)):
-                checks.append(await self.check_channel(node, channel_index=i + 1))
+                checks.append(self._check_channel(node_id, channels or (), i + 1))
 
         # Security checks (always run if config available)
-        if node.config.get("security"):
-            checks.append(await self.check_admin_key(node))
-            checks.append(await self.check_serial_disabled(node))
-        
+        if security:
+            checks.append(self._check_admin_key(node_id, security))
+            checks.append(self._check_serial_disabled(node_id, security))
+
         # Channel encryption checks
-        if node.config.get("channels"):
-            checks.extend(await self.check_channel_encryption(node))
+        if channels:
+            checks.extend(self._check_channel_encryption(node_id, channels))
 
         return checks
 
-    async def check_admin_key(self, node: Node) -> ConfigCheck:
+    def check_admin_key(self, node: Node) -> ConfigCheck:
         """Check if node has admin key configured.
 
         Args:
@@ -202,13 +259,24 @@ class ConfigChecker:
         Returns:
             ConfigCheck result
         """
-        security = node.config.get("security", {})
+        return self._check_admin_key(node.id, node.config.get("security") or _EMPTY_SECTION)
+
+    def _check_admin_key(self, node_id: str, security: Mapping[str, Any]) -> ConfigCheck:
+        """Check if node has admin key configured.
+
+        Args:
+            node_id: ID of the node being checked
+            security: Security config section
+
+        Returns:
+            ConfigCheck result
+        """
         admin_key_set = security.get("admin_key_set", False)
         admin_key = security.get("admin_key")
 
         if not admin_key_set:
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="admin_key",
                 expected_value="Admin key set",
                 actual_value=None,
@@ -216,10 +284,10 @@ class ConfigChecker:
                 message="Admin key not configured",
             )
 
-        # Check for default/weak keys (AQ== in base64 is 0x01)
-        if admin_key == "01" or admin_key == "00":
+        # Check for default/weak keys
+        if admin_key in _WEAK_ADMIN_KEYS:
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="admin_key",
                 expected_value="Secure admin key",
                 actual_value=f"{admin_key[:8]}...",
@@ -228,7 +296,7 @@ class ConfigChecker:
             )
 
         return ConfigCheck(
-            node_id=node.id,
+            node_id=node_id,
             check_type="admin_key",
             expected_value="Admin key set",
             actual_value=f"{admin_key[:8]}..." if admin_key else None,
@@ -236,7 +304,7 @@ class ConfigChecker:
             message="Admin key is configured",
         )
 
-    async def check_channel_encryption(self, node: Node) -> list[ConfigCheck]:
+    def check_channel_encryption(self, node: Node) -> list[ConfigCheck]:
         """Check if channels have encryption configured.
 
         Args:
@@ -245,13 +313,24 @@ class ConfigChecker:
         Returns:
             List of ConfigCheck results for each channel
         """
-        checks = []
-        channels = node.config.get("channels", [])
+        return self._check_channel_encryption(node.id, node.config.get("channels") or ())
+
+    def _check_channel_encryption(
+        self, node_id: str, channels: Sequence[dict[str, Any]]
+    ) -> list[ConfigCheck]:
+        """Check if channels have encryption configured.
+
+        Args:
+            node_id: ID of the node being checked
+            channels: Channel configurations
 
+        Returns:
+            List of ConfigCheck results for each channel
+        """
         if not channels:
             return [
                 ConfigCheck(
-                    node_id=node.id,
+                    node_id=node_id,
                     check_type="channel_encryption",
                     expected_value="Channels configured",
                     actual_value=None,
@@ -260,37 +339,43 @@ class ConfigChecker:
                 )
             ]
 
-        for channel in channels:
-            channel_name = channel.get("name", f"Channel {channel.get('index', '?')}")
-            psk_set = channel.get("psk_set", False)
-
-            if not psk_set:
-                checks.append(
-                    ConfigCheck(
-                        node_id=node.id,
-                        check_type="channel_encryption",
-                        expected_value=f"{channel_name} encrypted",
-                        actual_value="Not encrypted",
-                        status="warning",
-                        message=f"{channel_name} is not encrypted",
-                    )
-                )
-            else:
-                psk = channel.get("psk", "")
-                checks.append(
-                    ConfigCheck(
-                        node_id=node.id,
-                        check_type="channel_encryption",
-                        expected_value=f"{channel_name} encrypted",
-                        actual_value=f"PSK: {psk[:8]}..." if psk else "encrypted",
-                        status="pass",
-                        message=f"{channel_name} is encrypted",
-                    )
-                )
+        return [self._check_one_channel_encryption(node_id, channel) for channel in channels]
 
-        return checks
+    def _check_one_channel_encryption(self, node_id: str, channel: dict[str, Any]) -> ConfigCheck:
+        """Check if a single channel has encryption configured.
+
+        Args:
+            node_id: ID of the node being checked
+            channel: Channel configuration
+
+        Returns:
+            ConfigCheck result for the channel
+        """
+        channel_name = channel.get("name")
+        if channel_name is None:
+            channel_name = f"Channel {channel.get('index', '?')}"
+
+        if not channel.get("psk_set"):
+            return ConfigCheck(
+                node_id=node_id,
+                check_type="channel_encryption",
+                expected_value=f"{channel_name} encrypted",
+                actual_value="Not encrypted",
+                status="warning",
+                message=f"{channel_name} is not encrypted",
+            )
+
+        psk = channel.get("psk")
+        return ConfigCheck(
+            node_id=node_id,
+            check_type="channel_encryption",
+            expected_value=f"{channel_name} encrypted",
+            actual_value=f"PSK: {psk[:8]}..." if psk else "encrypted",
+            status="pass",
+            message=f"{channel_name} is encrypted",
+        )
 
-    async def check_serial_disabled(self, node: Node) -> ConfigCheck:
+    def check_serial_disabled(self, node: Node) -> ConfigCheck:
         """Check if serial console is disabled (optional security).
 
         Args:
@@ -299,12 +384,23 @@ class ConfigChecker:
         Returns:
             ConfigCheck result
         """
-        security = node.config.get("security", {})
+        return self._check_serial_disabled(node.id, node.config.get("security") or _EMPTY_SECTION)
+
+    def _check_serial_disabled(self, node_id: str, security: Mapping[str, Any]) -> ConfigCheck:
+        """Check if serial console is disabled (optional security).
+
+        Args:
+            node_id: ID of the node being checked
+            security: Security config section
+
+        Returns:
+            ConfigCheck result
+        """
         serial_enabled = security.get("serial_enabled", True)
 
         if serial_enabled:
             return ConfigCheck(
-                node_id=node.id,
+                node_id=node_id,
                 check_type="serial_access",
                 expected_value="Serial disabled",
                 actual_value="Serial enabled",
@@ -313,7 +409,7 @@ class ConfigChecker:
             )
 
         return ConfigCheck(
-            node_id=node.id,
+            node_id=node_id,
             check_type="serial_access",
             expected_value="Serial disabled",
             actual_value="Serial disabled",
@@ -321,18 +417,25 @@ class ConfigChecker:
             message="Serial console is disabled",
         )
 
-    async def check_all_nodes(self, nodes: list[Node]) -> list[ConfigCheck]:
+    def iter_checks(self, nodes: Iterable[Node]) -> Iterator[ConfigCheck]:
+        """Run configuration checks on nodes, yielding results as they are made.
+
+        Args:
+            nodes: Nodes to check
+
+        Yields:
+            ConfigCheck results, in node order
+        """
+        for node in nodes:
+            yield from self.check_node(node)
+
+    def check_all_nodes(self, nodes: list[Node]) -> list[ConfigCheck]:
         """Run configuration checks on all nodes.
 
         Args:
             nodes: List of nodes to check
 
         Returns:
-            List of all ConfigCheck results
+            List of all ConfigCheck results, in node order
         """
-        all_checks = []
-        for node in nodes:
-            checks = await self.check_node(node)
-            all_checks.extend(checks)
-
-        return all_checks
\ No newline at end of file
+        return [*self.iter_checks(nodes)]
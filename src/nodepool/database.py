@@ -1,18 +1,190 @@
 """Database operations for nodepool."""
 
 import json
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import aiosqlite
 
 from nodepool.models import ConfigCheck, ConfigSnapshot, HeardHistory, Node, Pool, PoolMembership
 
+try:
+    import orjson
+except ImportError:  # optional, from the "speedups" extra
+    orjson = None
+
+# Maximum number of IDs bound into a single IN (...) query
+_ID_CHUNK_SIZE = 500
+
+
+def _json_loads(text: str) -> Any:
+    """Parse a JSON text column, using orjson when installed.
+
+    Columns are always written with the standard library, which stores
+    non-finite floats as NaN/Infinity; orjson rejects those, so such rows
+    are parsed with the standard library instead. orjson reads integers
+    wider than 64 bits as floats, which Meshtastic config values never are.
+    """
+    if orjson is None:
+        return json.loads(text)
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+_UPSERT_NODE_SQL = """
+    INSERT INTO nodes (
+        id, short_name, long_name, hw_model,
+        firmware_version, first_seen, last_seen, is_active,
+        snr, hops_away, config
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        short_name = excluded.short_name,
+        long_name = excluded.long_name,
+        hw_model = CASE
+            WHEN excluded.hw_model IS NOT NULL THEN excluded.hw_model
+            ELSE nodes.hw_model
+        END,
+        firmware_version = CASE
+            WHEN excluded.firmware_version IS NOT NULL THEN excluded.firmware_version
+            ELSE nodes.firmware_version
+        END,
+        last_seen = excluded.last_seen,
+        is_active = excluded.is_active,
+        snr = excluded.snr,
+        hops_away = excluded.hops_away,
+        config = CASE
+            WHEN excluded.config != '{}' THEN excluded.config
+            ELSE nodes.config
+        END
+"""
+
+_INSERT_HEARD_HISTORY_SQL = """
+    INSERT INTO heard_history (
+        node_id, long_name, seen_by, timestamp, snr, hops_away,
+        position_lat, position_lon
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SAVE_CONNECTION_SQL = """
+    INSERT INTO connections (node_id, connection_string, connected_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(node_id) DO UPDATE SET
+        connection_string = excluded.connection_string,
+        connected_at = excluded.connected_at
+"""
+
+_INSERT_CONFIG_CHECK_SQL = """
+    INSERT INTO config_checks (
+        node_id, timestamp, check_type, expected_value,
+        actual_value, status, message
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _node_params(node: Node) -> tuple:
+    """Build the parameter tuple for _UPSERT_NODE_SQL."""
+    return (
+        node.id,
+        node.short_name,
+        node.long_name,
+        node.hw_model,
+        node.firmware_version,
+        node.first_seen.isoformat(),
+        node.last_seen.isoformat(),
+        1 if node.is_active else 0,
+        node.snr,
+        node.hops_away,
+        json.dumps(node.config),
+    )
+
+
+def _heard_history_params(history: HeardHistory) -> tuple:
+    """Build the parameter tuple for _INSERT_HEARD_HISTORY_SQL."""
+    return (
+        history.node_id,
+        history.long_name,
+        history.seen_by,
+        history.timestamp.isoformat(),
+        history.snr,
+        history.hops_away,
+        history.position_lat,
+        history.position_lon,
+    )
+
+
+def _config_check_params(check: ConfigCheck) -> tuple:
+    """Build the parameter tuple for _INSERT_CONFIG_CHECK_SQL."""
+    return (
+        check.node_id,
+        check.timestamp.isoformat(),
+        check.check_type,
+        json.dumps(check.expected_value),
+        json.dumps(check.actual_value),
+        check.status,
+        check.message,
+    )
+
+
+class WriteBatch:
+    """Rows queued by AsyncDatabase.batch() for a single bulk write.
+
+    After the batch is flushed, ``new_node_ids`` holds the IDs of queued
+    nodes that did not exist before the write.
+    """
+
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.node_rows: list[tuple] = []
+        self.connection_rows: list[tuple] = []
+        self.heard_history_rows: list[tuple] = []
+        self.config_check_rows: list[tuple] = []
+        self.new_node_ids: set[str] = set()
+
+    def upsert_node(self, node: Node) -> None:
+        """Queue a node insert-or-update.
+
+        Args:
+            node: Node object to save
+        """
+        self.node_rows.append(_node_params(node))
+
+    def save_connection(self, node_id: str, connection_string: str) -> None:
+        """Queue a node connection insert-or-update.
+
+        Args:
+            node_id: Node ID
+            connection_string: Connection string (e.g., /dev/cu.usbmodem123, tcp://192.168.1.100:4403)
+        """
+        self.connection_rows.append((node_id, connection_string, datetime.now().isoformat()))
+
+    def insert_history(self, history: HeardHistory) -> None:
+        """Queue a heard history entry.
+
+        Args:
+            history: HeardHistory object to save
+        """
+        self.heard_history_rows.append(_heard_history_params(history))
+
+    def insert_config_check(self, check: ConfigCheck) -> None:
+        """Queue a configuration check result.
+
+        Args:
+            check: ConfigCheck object to save
+        """
+        self.config_check_rows.append(_config_check_params(check))
+
 
 class AsyncDatabase:
     """Async SQLite database for storing node information."""
 
+    # Open databases shared via acquire(), keyed by resolved path
+    _pool: ClassVar[dict[str, "AsyncDatabase"]] = {}
+
     def __init__(self, db_path: str | Path = "nodepool.db"):
         """Initialize database connection.
 
@@ -21,20 +193,75 @@ class AsyncDatabase:
         """
         self.db_path = Path(db_path)
         self._conn: aiosqlite.Connection | None = None
+        self._initialized = False
 
     async def connect(self) -> None:
         """Connect to the database."""
         self._conn = await aiosqlite.connect(self.db_path)
         self._conn.row_factory = aiosqlite.Row
+        # WAL with NORMAL sync avoids an fsync per commit; reads of the
+        # database file go through a 256 MiB memory map. Ignored for :memory:.
+        # busy_timeout makes a second nodepool process wait for the write
+        # lock instead of failing with "database is locked"
+        await self._conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -64000;
+            PRAGMA mmap_size = 268435456;
+            PRAGMA wal_autocheckpoint = 1000;
+            PRAGMA busy_timeout = 5000;
+            """
+        )
 
     async def close(self) -> None:
         """Close the database connection."""
         if self._conn:
+            # Refresh planner statistics for indexes this session used
+            await self._conn.execute("PRAGMA optimize")
             await self._conn.close()
             self._conn = None
+            self._initialized = False
+
+    @classmethod
+    @asynccontextmanager
+    async def acquire(cls, db_path: str | Path = "nodepool.db") -> AsyncIterator["AsyncDatabase"]:
+        """Borrow the shared connection for a database path.
+
+        The first caller opens the connection; later callers reuse it until
+        close_pool() is called.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Yields:
+            Connected AsyncDatabase instance
+        """
+        key = str(db_path) if str(db_path) == ":memory:" else str(Path(db_path).resolve())
+        database = cls._pool.get(key)
+        if database is None:
+            database = cls(db_path)
+            await database.connect()
+            cls._pool[key] = database
+        yield database
+
+    @classmethod
+    async def close_pool(cls) -> None:
+        """Close every connection opened through acquire()."""
+        databases = list(cls._pool.values())
+        cls._pool.clear()
+        for database in databases:
+            await database.close()
 
     async def initialize(self) -> None:
-        """Initialize database schema."""
+        """Initialize database schema.
+
+        Only the first call on an open connection does any work, so commands
+        sharing a connection through acquire() can call this freely.
+        """
+        if self._initialized:
+            return
         if not self._conn:
             await self.connect()
 
@@ -119,7 +346,9 @@ class AsyncDatabase:
             CREATE INDEX IF NOT EXISTS idx_checks_node ON config_checks(node_id);
             CREATE INDEX IF NOT EXISTS idx_checks_timestamp ON config_checks(timestamp);
             CREATE INDEX IF NOT EXISTS idx_heard_node ON heard_history(node_id);
-            CREATE INDEX IF NOT EXISTS idx_heard_by ON heard_history(seen_by);
+            DROP INDEX IF EXISTS idx_heard_by;
+            CREATE INDEX IF NOT EXISTS idx_heard_by_node ON heard_history(seen_by, node_id);
+            CREATE INDEX IF NOT EXISTS idx_nodes_last_seen ON nodes(last_seen);
             CREATE INDEX IF NOT EXISTS idx_heard_time ON heard_history(timestamp);
             """
         )
@@ -127,6 +356,7 @@ class AsyncDatabase:
 
         # Ensure default pool exists
         await self._ensure_default_pool()
+        self._initialized = True
 
     async def _ensure_default_pool(self) -> None:
         """Ensure the default pool exists."""
@@ -157,47 +387,7 @@ class AsyncDatabase:
         if not self._conn:
             await self.connect()
 
-        await self._conn.execute(
-            """
-            INSERT INTO nodes (
-                id, short_name, long_name, hw_model,
-                firmware_version, first_seen, last_seen, is_active,
-                snr, hops_away, config
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                short_name = excluded.short_name,
-                long_name = excluded.long_name,
-                hw_model = CASE 
-                    WHEN excluded.hw_model IS NOT NULL THEN excluded.hw_model
-                    ELSE nodes.hw_model
-                END,
-                firmware_version = CASE 
-                    WHEN excluded.firmware_version IS NOT NULL THEN excluded.firmware_version
-                    ELSE nodes.firmware_version
-                END,
-                last_seen = excluded.last_seen,
-                is_active = excluded.is_active,
-                snr = excluded.snr,
-                hops_away = excluded.hops_away,
-                config = CASE
-                    WHEN excluded.config != '{}' THEN excluded.config
-                    ELSE nodes.config
-                END
-            """,
-            (
-                node.id,
-                node.short_name,
-                node.long_name,
-                node.hw_model,
-                node.firmware_version,
-                node.first_seen.isoformat(),
-                node.last_seen.isoformat(),
-                1 if node.is_active else 0,
-                node.snr,
-                node.hops_away,
-                json.dumps(node.config),
-            ),
-        )
+        await self._conn.execute(_UPSERT_NODE_SQL, _node_params(node))
         await self._conn.commit()
 
     async def get_node(self, node_id: str) -> Node | None:
@@ -223,27 +413,94 @@ class AsyncDatabase:
 
         return self._row_to_node(row)
 
-    async def get_all_nodes(self, active_only: bool = True) -> list[Node]:
-        """Get all nodes from the database.
+    async def get_existing_ids(self, ids: Iterable[str]) -> set[str]:
+        """Get the subset of node IDs that already exist in the database.
 
         Args:
-            active_only: If True, only return active nodes
+            ids: Node IDs to look up
 
         Returns:
-            List of Node objects
+            Set of node IDs present in the nodes table
         """
         if not self._conn:
             await self.connect()
 
-        query = "SELECT * FROM nodes"
+        ids = list(ids)
+        existing: set[str] = set()
+
+        # Chunk to stay well below SQLite's bound-parameter limit
+        for start in range(0, len(ids), _ID_CHUNK_SIZE):
+            chunk = ids[start : start + _ID_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = await self._conn.execute(
+                f"SELECT id FROM nodes WHERE id IN ({placeholders})",
+                chunk,
+            )
+            existing.update(row["id"] for row in await cursor.fetchall())
+
+        return existing
+
+    async def get_all_node_ids(self) -> set[str]:
+        """Get the IDs of all nodes in the database.
+
+        Returns:
+            Set of node IDs
+        """
+        if not self._conn:
+            await self.connect()
+
+        cursor = await self._conn.execute("SELECT id FROM nodes")
+        return {row["id"] for row in await cursor.fetchall()}
+
+    async def iter_nodes(
+        self, active_only: bool = True, managed: bool | None = None
+    ) -> AsyncIterator[Node]:
+        """Yield nodes from the database one at a time.
+
+        Rows are fetched from the cursor in chunks, so callers that process
+        nodes as they arrive never hold the whole table in memory.
+
+        Args:
+            active_only: If True, only yield active nodes
+            managed: If True, only yield nodes with a managed connection;
+                if False, only nodes without one; if None, don't filter
+
+        Yields:
+            Node objects ordered by short name
+        """
+        if not self._conn:
+            await self.connect()
+
+        conditions = []
         if active_only:
-            query += " WHERE is_active = 1"
+            conditions.append("is_active = 1")
+        if managed is not None:
+            exists = "EXISTS (SELECT 1 FROM connections c WHERE c.node_id = nodes.id)"
+            conditions.append(exists if managed else f"NOT {exists}")
+
+        query = "SELECT * FROM nodes"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
         query += " ORDER BY short_name"
 
-        cursor = await self._conn.execute(query)
-        rows = await cursor.fetchall()
+        async with self._conn.execute(query) as cursor:
+            async for row in cursor:
+                yield self._row_to_node(row)
 
-        return [self._row_to_node(row) for row in rows]
+    async def get_all_nodes(
+        self, active_only: bool = True, managed: bool | None = None
+    ) -> list[Node]:
+        """Get all nodes from the database.
+
+        Args:
+            active_only: If True, only return active nodes
+            managed: If True, only return nodes with a managed connection;
+                if False, only nodes without one; if None, don't filter
+
+        Returns:
+            List of Node objects
+        """
+        return [node async for node in self.iter_nodes(active_only, managed)]
 
     async def save_config_snapshot(self, snapshot: ConfigSnapshot) -> None:
         """Save a configuration snapshot.
@@ -276,23 +533,7 @@ class AsyncDatabase:
         if not self._conn:
             await self.connect()
 
-        await self._conn.execute(
-            """
-            INSERT INTO config_checks (
-                node_id, timestamp, check_type, expected_value,
-                actual_value, status, message
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                check.node_id,
-                check.timestamp.isoformat(),
-                check.check_type,
-                json.dumps(check.expected_value),
-                json.dumps(check.actual_value),
-                check.status,
-                check.message,
-            ),
-        )
+        await self._conn.execute(_INSERT_CONFIG_CHECK_SQL, _config_check_params(check))
         await self._conn.commit()
 
     async def get_latest_checks(self, node_id: str | None = None) -> list[ConfigCheck]:
@@ -335,26 +576,47 @@ class AsyncDatabase:
         if not self._conn:
             await self.connect()
 
-        await self._conn.execute(
-            """
-            INSERT INTO heard_history (
-                node_id, long_name, seen_by, timestamp, snr, hops_away,
-                position_lat, position_lon
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                history.node_id,
-                history.long_name,
-                history.seen_by,
-                history.timestamp.isoformat(),
-                history.snr,
-                history.hops_away,
-                history.position_lat,
-                history.position_lon,
-            ),
-        )
+        await self._conn.execute(_INSERT_HEARD_HISTORY_SQL, _heard_history_params(history))
         await self._conn.commit()
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator["WriteBatch"]:
+        """Buffer writes and flush them in a single transaction.
+
+        Rows queued on the yielded batch are written with ``executemany`` when
+        the block exits, so N saves cost one commit instead of N. Nothing is
+        written if the block raises.
+
+        Yields:
+            WriteBatch to queue rows on
+        """
+        if not self._conn:
+            await self.connect()
+
+        batch = WriteBatch()
+        yield batch
+
+        try:
+            if batch.node_rows:
+                # Classify inserts vs updates as part of the same write
+                node_ids = {row[0] for row in batch.node_rows}
+                batch.new_node_ids = node_ids - await self.get_existing_ids(node_ids)
+                await self._conn.executemany(_UPSERT_NODE_SQL, batch.node_rows)
+            if batch.connection_rows:
+                await self._conn.executemany(_SAVE_CONNECTION_SQL, batch.connection_rows)
+            if batch.heard_history_rows:
+                await self._conn.executemany(
+                    _INSERT_HEARD_HISTORY_SQL, batch.heard_history_rows
+                )
+            if batch.config_check_rows:
+                await self._conn.executemany(
+                    _INSERT_CONFIG_CHECK_SQL, batch.config_check_rows
+                )
+            await self._conn.commit()
+        except Exception:
+            await self._conn.rollback()
+            raise
+
     async def get_default_pool(self) -> Pool:
         """Get the default pool.
 
@@ -408,13 +670,7 @@ class AsyncDatabase:
             await self.connect()
 
         await self._conn.execute(
-            """
-            INSERT INTO connections (node_id, connection_string, connected_at)
-            VALUES (?, ?, ?)
-            ON CONFLICT(node_id) DO UPDATE SET
-                connection_string = excluded.connection_string,
-                connected_at = excluded.connected_at
-            """,
+            _SAVE_CONNECTION_SQL,
             (node_id, connection_string, datetime.now().isoformat()),
         )
         await self._conn.commit()
@@ -434,9 +690,12 @@ class AsyncDatabase:
         )
         await self._conn.commit()
 
-    async def get_connected_nodes(self) -> list[tuple[Node, str]]:
+    async def get_connected_nodes(self, port: str | None = None) -> list[tuple[Node, str]]:
         """Get all connected nodes with their connection strings.
 
+        Args:
+            port: Only return the node connected via this connection string
+
         Returns:
             List of tuples (Node, connection_string)
         """
@@ -447,11 +706,11 @@ class AsyncDatabase:
             SELECT n.*, c.connection_string
             FROM nodes n
             JOIN connections c ON n.id = c.node_id
-            WHERE n.is_active = 1
+            WHERE n.is_active = 1 AND (?1 IS NULL OR c.connection_string = ?1)
             ORDER BY n.short_name
         """
 
-        cursor = await self._conn.execute(query)
+        cursor = await self._conn.execute(query, (port,))
         rows = await cursor.fetchall()
 
         result = []
@@ -462,6 +721,33 @@ class AsyncDatabase:
 
         return result
 
+    async def get_nodes_with_connections(
+        self, active_only: bool = True
+    ) -> list[tuple[Node, str | None]]:
+        """Get nodes together with their connection strings, if any.
+
+        Args:
+            active_only: If True, only return active nodes
+
+        Returns:
+            List of tuples (Node, connection_string or None)
+        """
+        if not self._conn:
+            await self.connect()
+
+        query = """
+            SELECT n.*, c.connection_string
+            FROM nodes n
+            LEFT JOIN connections c ON n.id = c.node_id
+            WHERE (? OR n.is_active = 1)
+            ORDER BY n.short_name
+        """
+
+        cursor = await self._conn.execute(query, (0 if active_only else 1,))
+        rows = await cursor.fetchall()
+
+        return [(self._row_to_node(row), row["connection_string"]) for row in rows]
+
     async def add_node_to_pool(self, pool_id: int, node_id: str) -> None:
         """Add a node to a pool.
 
@@ -520,12 +806,16 @@ class AsyncDatabase:
             await self.connect()
 
         if seen_by:
+            # Semi-join: stop at the first matching history row per node
+            # rather than joining every row and de-duplicating with DISTINCT
             query = """
-                SELECT DISTINCT n.*
+                SELECT n.*
                 FROM nodes n
-                LEFT JOIN connections c ON n.id = c.node_id
-                JOIN heard_history h ON n.id = h.node_id
-                WHERE c.node_id IS NULL AND h.seen_by = ?
+                WHERE NOT EXISTS (SELECT 1 FROM connections c WHERE c.node_id = n.id)
+                AND EXISTS (
+                    SELECT 1 FROM heard_history h
+                    WHERE h.seen_by = ? AND h.node_id = n.id
+                )
                 ORDER BY n.last_seen DESC
             """
             cursor = await self._conn.execute(query, (seen_by,))
@@ -533,8 +823,7 @@ class AsyncDatabase:
             query = """
                 SELECT n.*
                 FROM nodes n
-                LEFT JOIN connections c ON n.id = c.node_id
-                WHERE c.node_id IS NULL
+                WHERE NOT EXISTS (SELECT 1 FROM connections c WHERE c.node_id = n.id)
                 ORDER BY n.last_seen DESC
             """
             cursor = await self._conn.execute(query)
@@ -581,7 +870,7 @@ class AsyncDatabase:
             is_active=bool(row["is_active"]),
             snr=row["snr"],
             hops_away=row["hops_away"],
-            config=json.loads(row["config"]),
+            config=_json_loads(row["config"]),
         )
 
     def _row_to_pool(self, row: aiosqlite.Row) -> Pool:
@@ -613,8 +902,8 @@ class AsyncDatabase:
         return ConfigCheck(
             node_id=row["node_id"],
             check_type=row["check_type"],
-            expected_value=json.loads(row["expected_value"]),
-            actual_value=json.loads(row["actual_value"]),
+            expected_value=_json_loads(row["expected_value"]),
+            actual_value=_json_loads(row["actual_value"]),
             status=row["status"],
             message=row["message"],
             timestamp=datetime.fromisoformat(row["timestamp"]),
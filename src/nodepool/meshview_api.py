@@ -1,7 +1,13 @@
 """MeshView API client for fetching node data."""
 
 import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
 import aiohttp
@@ -11,17 +17,39 @@ from nodepool.models import HeardHistory, Node
 
 console = Console()
 
+# How long a cached API response is reused, in seconds
+CACHE_TTL = 300.0
+
+
+def default_cache_dir() -> Path:
+    """Return the directory used to cache MeshView API responses.
+
+    Returns:
+        $XDG_CACHE_HOME/nodepool, or ~/.cache/nodepool if it is not set
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "nodepool"
+
 
 class MeshViewAPIClient:
     """Client for fetching node data from MeshView API."""
 
-    def __init__(self, base_url: str = "https://meshview.bayme.sh"):
+    def __init__(
+        self,
+        base_url: str = "https://meshview.bayme.sh",
+        cache_dir: Path | None = None,
+        cache_ttl: float = CACHE_TTL,
+    ):
         """Initialize MeshView API client.
 
         Args:
             base_url: Base URL for the MeshView API
+            cache_dir: Directory to cache API responses in, or None to disable caching
+            cache_ttl: Seconds a cached response stays fresh
         """
         self.base_url = base_url.rstrip("/")
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
 
     async def fetch_nodes(self, days_active: int = 3) -> tuple[list[Node], list[HeardHistory]]:
         """Fetch nodes from the MeshView API.
@@ -36,6 +64,56 @@ class MeshViewAPIClient:
             aiohttp.ClientError: If the API request fails
             ValueError: If the API response is invalid
         """
+        node_list = await self._fetch_node_list(days_active)
+        return self._parse_entries(node_list, datetime.now(timezone.utc))
+
+    async def fetch_node_pages(
+        self, days_active: int = 3, page_size: int = 500
+    ) -> AsyncIterator[tuple[list[Node], list[HeardHistory]]]:
+        """Fetch nodes from the MeshView API and yield them in pages.
+
+        The API returns every node in one response; parsing it page by page
+        lets callers save each page while the next one is being parsed.
+
+        Args:
+            days_active: Number of days of activity to filter by
+            page_size: Maximum number of API entries per page
+
+        Yields:
+            Tuples of (list of Node objects, list of HeardHistory objects)
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+            ValueError: If the API response is invalid
+        """
+        node_list = await self._fetch_node_list(days_active)
+        now = datetime.now(timezone.utc)
+
+        for start in range(0, len(node_list), page_size):
+            yield self._parse_entries(node_list[start : start + page_size], now)
+            # Let pending work (e.g. database writes of this page) proceed
+            await asyncio.sleep(0)
+
+    async def _fetch_node_list(self, days_active: int) -> list[dict[str, Any]]:
+        """Request the raw node entries from the API.
+
+        Args:
+            days_active: Number of days of activity to filter by
+
+        Returns:
+            List of node entries as returned by the API
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+            ValueError: If the API response is invalid
+        """
+        loop = asyncio.get_running_loop()
+        cache_path = self._cache_path(days_active)
+        if cache_path is not None:
+            cached = await loop.run_in_executor(None, self._read_cache, cache_path)
+            if cached is not None:
+                return cached
+
         url = f"{self.base_url}/api/nodes"
         params = {"days_active": days_active}
 
@@ -46,18 +124,83 @@ class MeshViewAPIClient:
 
         # Handle both direct list and {"nodes": [...]} format
         if isinstance(data, dict):
-            if "nodes" in data:
-                node_list = data["nodes"]
-            else:
-                raise ValueError(f"Expected 'nodes' key in response, got keys: {list(data.keys())}")
+            if "nodes" not in data:
+                raise ValueError(
+                    f"Expected 'nodes' key in response, got keys: {list(data.keys())}"
+                )
+            node_list = data["nodes"]
         elif isinstance(data, list):
             node_list = data
         else:
             raise ValueError(f"Expected list or dict with 'nodes', got {type(data)}")
 
+        if cache_path is not None:
+            await loop.run_in_executor(None, self._write_cache, cache_path, node_list)
+        return node_list
+
+    def _cache_path(self, days_active: int) -> Path | None:
+        """Return the cache file for a request, or None if caching is disabled.
+
+        Args:
+            days_active: Number of days of activity to filter by
+
+        Returns:
+            Cache file path keyed by base URL and days_active
+        """
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(f"{self.base_url}|{days_active}".encode()).hexdigest()[:16]
+        return self.cache_dir / f"meshview-{key}.json"
+
+    def _read_cache(self, path: Path) -> list[dict[str, Any]] | None:
+        """Load a cached node list if it is still fresh (blocking).
+
+        Args:
+            path: Cache file
+
+        Returns:
+            Cached node entries, or None if missing, stale or unreadable
+        """
+        try:
+            if time.time() - path.stat().st_mtime >= self.cache_ttl:
+                return None
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, list) else None
+
+    def _write_cache(self, path: Path, node_list: list[dict[str, Any]]) -> None:
+        """Store a node list in the cache (blocking, best effort).
+
+        Args:
+            path: Cache file
+            node_list: Node entries to cache
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(node_list))
+            tmp_path.replace(path)
+        except (OSError, TypeError, ValueError) as e:
+            console.print(f"[yellow]Warning: Could not cache MeshView response: {e}[/yellow]")
+
+    def _parse_entries(
+        self, node_list: list[dict[str, Any]], now: datetime
+    ) -> tuple[list[Node], list[HeardHistory]]:
+        """Parse raw API entries into nodes and heard history.
+
+        Invalid entries are skipped with a warning.
+
+        Args:
+            node_list: Node entries from the API
+            now: Time the data was fetched
+
+        Returns:
+            Tuple of (list of Node objects, list of HeardHistory objects)
+        """
         nodes = []
         heard_history = []
-        now = datetime.now(timezone.utc)
 
         for node_data in node_list:
             try:
@@ -4,6 +4,7 @@ import asyncio
 import logging
 import platform
 import queue
+import sys
 import threading
 from collections.abc import Callable
 from datetime import datetime
@@ -15,6 +16,32 @@ from nodepool.models import HeardHistory, Node, NodeStatus
 logger = logging.getLogger(__name__)
 
 
+def _open_serial_interface(port: str) -> Any:
+    """Open a Meshtastic serial interface with the port in low-latency mode.
+
+    On Linux, USB-serial adapters may hold received bytes for up to 16ms
+    before handing them to the reader, which adds up over the many
+    request/response round-trips of a config read. Low-latency mode is
+    best effort: drivers that do not support it are left as they are.
+
+    Args:
+        port: Serial port path
+
+    Returns:
+        Connected meshtastic SerialInterface
+    """
+    import meshtastic.serial_interface
+
+    interface = meshtastic.serial_interface.SerialInterface(port)
+    if sys.platform == "linux":
+        try:
+            # pyserial sets the ASYNC_LOW_LATENCY flag via TIOCSSERIAL
+            interface.stream.set_low_latency_mode(True)
+        except (AttributeError, OSError, ValueError) as e:
+            logger.debug(f"Low-latency mode unavailable on {port}: {e}")
+    return interface
+
+
 class MessageResponseHandler:
     """Handles message responses and ACKs from Meshtastic interface using stream interception."""
 
@@ -494,8 +521,7 @@ class NodeManager:
                 host_port = connection_string[6:]  # Remove "tcp://"
                 interface = meshtastic.tcp_interface.TCPInterface(hostname=host_port)
             else:
-                import meshtastic.serial_interface
-                interface = meshtastic.serial_interface.SerialInterface(connection_string)
+                interface = _open_serial_interface(connection_string)
 
             # Get node info
             my_info = interface.myInfo
@@ -576,10 +602,8 @@ class NodeManager:
             Exception: If no node found or connection fails
         """
         try:
-            import meshtastic.serial_interface
-
             # Connect with protocol enabled to properly query node information
-            interface = meshtastic.serial_interface.SerialInterface(port)
+            interface = _open_serial_interface(port)
 
             # Get node info from myInfo (protobuf object)
             my_info = interface.myInfo
@@ -1054,17 +1078,32 @@ class NodeManager:
             raise ValueError("No response from node")
         interface.close()
 
-    async def check_all_reachability(self, nodes: list[Node]) -> list[NodeStatus]:
+    async def check_all_reachability(
+        self,
+        nodes: list[Node],
+        connections: dict[str, str] | None = None,
+        concurrency: int = 8,
+    ) -> list[NodeStatus]:
         """Check reachability of all nodes concurrently.
 
+        At most ``concurrency`` nodes are probed at a time.
+
         Args:
             nodes: List of nodes to check
+            connections: Optional mapping of node ID to serial port to probe
+            concurrency: Maximum number of nodes probed at once
 
         Returns:
-            List of NodeStatus objects
+            List of NodeStatus objects, in node order
         """
-        tasks = [self.check_node_reachability(node) for node in nodes]
-        return await asyncio.gather(*tasks)
+        connections = connections or {}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _check(node: Node) -> NodeStatus:
+            async with semaphore:
+                return await self.check_node_reachability(node, connections.get(node.id))
+
+        return await asyncio.gather(*[_check(node) for node in nodes])
 
     async def send_pki_message(
         self,
@@ -1199,8 +1238,7 @@ class NodeManager:
             host_port = connection_string[6:]  # Remove "tcp://"
             interface = meshtastic.tcp_interface.TCPInterface(hostname=host_port)
         else:
-            import meshtastic.serial_interface
-            interface = meshtastic.serial_interface.SerialInterface(connection_string)
+            interface = _open_serial_interface(connection_string)
 
         heard_nodes = []
         heard_history = []
@@ -1279,8 +1317,7 @@ class NodeManager:
                 host_port = via_connection[6:]
                 interface = meshtastic.tcp_interface.TCPInterface(hostname=host_port)
             else:
-                import meshtastic.serial_interface
-                interface = meshtastic.serial_interface.SerialInterface(via_connection)
+                interface = _open_serial_interface(via_connection)
             
             # Give interface time to populate nodes list
             logger.info("Waiting for node list to populate...")
@@ -1405,8 +1442,7 @@ class NodeManager:
                 host_port = via_connection[6:]
                 interface = meshtastic.tcp_interface.TCPInterface(hostname=host_port)
             else:
-                import meshtastic.serial_interface
-                interface = meshtastic.serial_interface.SerialInterface(via_connection)
+                interface = _open_serial_interface(via_connection)
             
             # Give interface time to populate nodes list
             logger.info(f"Waiting for node list to populate...")
@@ -1534,8 +1570,7 @@ class NodeManager:
             host_port = via_connection[6:]
             interface = meshtastic.tcp_interface.TCPInterface(hostname=host_port)
         else:
-            import meshtastic.serial_interface
-            interface = meshtastic.serial_interface.SerialInterface(via_connection)
+            interface = _open_serial_interface(via_connection)
         
         try:
             # Give interface time to populate
@@ -1,11 +1,47 @@
 """Tests for CLI commands."""
 
+import asyncio
+import json
+import math
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
-from nodepool.cli import cli
+from nodepool.cli import (
+    _config_lines,
+    _get_json_dumps,
+    _iter_json_array,
+    _uvloop_factory,
+    cli,
+    run_async,
+)
+from nodepool.database import WriteBatch
+
+
+def use_mock_db(mock_db_class, mock_db):
+    """Make a patched AsyncDatabase class hand out the given mock."""
+    mock_db_class.return_value = mock_db
+    mock_db_class.acquire.return_value = mock_db
+    mock_db_class.close_pool = AsyncMock()
+
+
+def use_fake_batches(mock_db, stored_ids=()):
+    """Make mock_db.batch() report new node IDs against a simulated table."""
+    stored = set(stored_ids)
+
+    @asynccontextmanager
+    async def batch():
+        write_batch = WriteBatch()
+        yield write_batch
+        queued = {row[0] for row in write_batch.node_rows}
+        write_batch.new_node_ids = queued - stored
+        stored.update(queued)
+
+    mock_db.batch = batch
 
 
 @pytest.fixture
@@ -43,8 +79,8 @@ def test_cli_help(runner):
     assert "check" in result.output
 
 
-@patch("nodepool.cli.NodeManager")
-@patch("nodepool.cli.AsyncDatabase")
+@patch("nodepool.node_manager.NodeManager")
+@patch("nodepool.database.AsyncDatabase")
 def test_discover_command(mock_db_class, mock_manager_class, runner, sample_node):
     """Test discover command."""
     # Setup mocks
@@ -55,10 +91,11 @@ def test_discover_command(mock_db_class, mock_manager_class, runner, sample_node
 
     mock_db = MagicMock()
     mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-    mock_db.__aexit__ = AsyncMock()
+    mock_db.__aexit__ = AsyncMock(return_value=False)
     mock_db.initialize = AsyncMock()
-    mock_db.save_node = AsyncMock()
-    mock_db_class.return_value = mock_db
+    mock_db.get_all_node_ids = AsyncMock(return_value=set())
+    use_mock_db(mock_db_class, mock_db)
+    use_fake_batches(mock_db)
 
     result = runner.invoke(cli, ["discover"])
 
@@ -66,15 +103,47 @@ def test_discover_command(mock_db_class, mock_manager_class, runner, sample_node
     assert "Discovering" in result.output
 
 
-@patch("nodepool.cli.AsyncDatabase")
+@patch("nodepool.node_manager.NodeManager")
+@patch("nodepool.database.AsyncDatabase")
+def test_discover_command_with_ports(mock_db_class, mock_manager_class, runner, sample_node):
+    """Test discover scans only the ports given on the command line."""
+    async def discover_nodes(serial_ports, progress_callback):
+        progress_callback(serial_ports[0], sample_node)
+        return [sample_node]
+
+    mock_manager = MagicMock()
+    mock_manager._list_serial_ports = AsyncMock()
+    mock_manager.discover_nodes = AsyncMock(side_effect=discover_nodes)
+    mock_manager_class.return_value = mock_manager
+
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock(return_value=False)
+    mock_db.initialize = AsyncMock()
+    mock_db.get_all_node_ids = AsyncMock(return_value=set())
+    use_mock_db(mock_db_class, mock_db)
+    use_fake_batches(mock_db)
+
+    result = runner.invoke(cli, ["discover", "--ports", "/dev/ttyUSB0"])
+
+    assert result.exit_code == 0
+    mock_manager._list_serial_ports.assert_not_called()
+    assert mock_manager.discover_nodes.await_args.kwargs["serial_ports"] == ["/dev/ttyUSB0"]
+    assert "/dev/ttyUSB0 → NODE1" in result.output
+    assert "(new)" in result.output
+
+
+@patch("nodepool.database.AsyncDatabase")
 def test_list_command(mock_db_class, runner, sample_nodes):
     """Test list command."""
     mock_db = MagicMock()
     mock_db.__aenter__ = AsyncMock(return_value=mock_db)
     mock_db.__aexit__ = AsyncMock()
     mock_db.initialize = AsyncMock()
-    mock_db.get_all_nodes = AsyncMock(return_value=sample_nodes)
-    mock_db_class.return_value = mock_db
+    mock_db.get_connected_nodes = AsyncMock(
+        return_value=[(node, "/dev/ttyUSB0") for node in sample_nodes]
+    )
+    use_mock_db(mock_db_class, mock_db)
 
     result = runner.invoke(cli, ["list"])
 
@@ -83,15 +152,60 @@ def test_list_command(mock_db_class, runner, sample_nodes):
     assert "NODE2" in result.output
 
 
-@patch("nodepool.cli.AsyncDatabase")
+@patch("nodepool.database.AsyncDatabase")
+def test_list_command_all(mock_db_class, runner, sample_nodes):
+    """Test list --all shows every node with its connection, if any."""
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock()
+    mock_db.initialize = AsyncMock()
+    mock_db.get_nodes_with_connections = AsyncMock(
+        return_value=[
+            (sample_nodes[0], "/dev/ttyUSB0"),
+            (sample_nodes[1], None),
+            (sample_nodes[2], None),
+        ]
+    )
+    use_mock_db(mock_db_class, mock_db)
+
+    result = runner.invoke(cli, ["list", "--all"])
+
+    assert result.exit_code == 0
+    assert "All Nodes" in result.output
+    assert "NODE3" in result.output
+    assert "/dev/ttyUSB0" in result.output
+    mock_db.get_nodes_with_connections.assert_awaited_once_with(active_only=False)
+
+
+@patch("nodepool.database.AsyncDatabase")
+def test_list_command_heard_only(mock_db_class, runner, sample_nodes):
+    """Test list --heard-only shows signal columns, with ? for unknown values."""
+    sample_nodes[0].snr = 6.25
+    sample_nodes[0].hops_away = 2
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock(return_value=False)
+    mock_db.initialize = AsyncMock()
+    mock_db.get_heard_nodes = AsyncMock(return_value=sample_nodes)
+    use_mock_db(mock_db_class, mock_db)
+
+    result = runner.invoke(cli, ["list", "--heard-only"])
+
+    assert result.exit_code == 0
+    assert "Heard Nodes" in result.output
+    assert "6.2" in result.output
+    assert "?" in result.output
+
+
+@patch("nodepool.database.AsyncDatabase")
 def test_list_command_empty(mock_db_class, runner):
     """Test list command with empty database."""
     mock_db = MagicMock()
     mock_db.__aenter__ = AsyncMock(return_value=mock_db)
     mock_db.__aexit__ = AsyncMock()
     mock_db.initialize = AsyncMock()
-    mock_db.get_all_nodes = AsyncMock(return_value=[])
-    mock_db_class.return_value = mock_db
+    mock_db.get_connected_nodes = AsyncMock(return_value=[])
+    use_mock_db(mock_db_class, mock_db)
 
     result = runner.invoke(cli, ["list"])
 
@@ -99,7 +213,7 @@ def test_list_command_empty(mock_db_class, runner):
     assert "No nodes found" in result.output
 
 
-@patch("nodepool.cli.AsyncDatabase")
+@patch("nodepool.database.AsyncDatabase")
 def test_info_command(mock_db_class, runner, sample_node):
     """Test info command."""
     mock_db = MagicMock()
@@ -107,16 +221,37 @@ def test_info_command(mock_db_class, runner, sample_node):
     mock_db.__aexit__ = AsyncMock()
     mock_db.initialize = AsyncMock()
     mock_db.get_node = AsyncMock(return_value=sample_node)
-    mock_db_class.return_value = mock_db
+    mock_db.get_connection = AsyncMock(return_value="/dev/ttyUSB0")
+    use_mock_db(mock_db_class, mock_db)
 
     result = runner.invoke(cli, ["info", sample_node.id])
 
     assert result.exit_code == 0
     assert sample_node.short_name in result.output
     assert sample_node.id in result.output
+    assert "/dev/ttyUSB0" in result.output
+
+
+def test_config_lines_renders_enabled_modules():
+    """Test that only enabled modules are rendered, with defaults and units."""
+    lines = _config_lines(
+        {
+            "mqtt": {"enabled": True, "map_reporting_enabled": True},
+            "neighbor_info": {"enabled": True, "update_interval": 900},
+            "serial_module": {"enabled": True},
+            "paxcounter": {"enabled": False, "paxcounter_update_interval": 60},
+        }
+    )
 
+    assert "  [cyan]MQTT:[/cyan]" in lines
+    assert "    Map Reporting: True [green](OK to MQTT)[/green]" in lines
+    assert "    Update Interval: 900s" in lines
+    assert "    Baud: 0" in lines
+    assert "    Echo: False" in lines
+    assert "  [cyan]Paxcounter:[/cyan]" not in lines
 
-@patch("nodepool.cli.AsyncDatabase")
+
+@patch("nodepool.database.AsyncDatabase")
 def test_info_command_not_found(mock_db_class, runner):
     """Test info command with non-existent node."""
     mock_db = MagicMock()
@@ -124,7 +259,7 @@ def test_info_command_not_found(mock_db_class, runner):
     mock_db.__aexit__ = AsyncMock()
     mock_db.initialize = AsyncMock()
     mock_db.get_node = AsyncMock(return_value=None)
-    mock_db_class.return_value = mock_db
+    use_mock_db(mock_db_class, mock_db)
 
     result = runner.invoke(cli, ["info", "!nonexistent"])
 
@@ -132,8 +267,8 @@ def test_info_command_not_found(mock_db_class, runner):
     assert "not found" in result.output
 
 
-@patch("nodepool.cli.ConfigChecker")
-@patch("nodepool.cli.AsyncDatabase")
+@patch("nodepool.config_checker.ConfigChecker")
+@patch("nodepool.database.AsyncDatabase")
 def test_check_command(mock_db_class, mock_checker_class, runner, sample_nodes, sample_node):
     """Test check command."""
     from nodepool.models import ConfigCheck
@@ -145,7 +280,7 @@ def test_check_command(mock_db_class, mock_checker_class, runner, sample_nodes,
     mock_db.initialize = AsyncMock()
     mock_db.get_all_nodes = AsyncMock(return_value=sample_nodes)
     mock_db.save_config_check = AsyncMock()
-    mock_db_class.return_value = mock_db
+    use_mock_db(mock_db_class, mock_db)
 
     # Setup checker mock
     mock_checker = MagicMock()
@@ -157,17 +292,22 @@ def test_check_command(mock_db_class, mock_checker_class, runner, sample_nodes,
         status="pass",
         message="TTL correctly set",
     )
-    mock_checker.check_all_nodes = AsyncMock(return_value=[check_result])
+    mock_checker.check_node = MagicMock(
+        side_effect=lambda node: [check_result] if node.id == sample_node.id else []
+    )
     mock_checker_class.return_value = mock_checker
 
     result = runner.invoke(cli, ["check"])
 
     assert result.exit_code == 0
     assert "Running configuration checks" in result.output
+    assert "TTL correctly set" in result.output
+    assert "Passed: 1" in result.output
+    assert mock_checker.check_node.call_count == len(sample_nodes)
 
 
-@patch("nodepool.cli.NodeManager")
-@patch("nodepool.cli.AsyncDatabase")
+@patch("nodepool.node_manager.NodeManager")
+@patch("nodepool.database.AsyncDatabase")
 def test_status_command(mock_db_class, mock_manager_class, runner, sample_nodes):
     """Test status command."""
     from nodepool.models import NodeStatus
@@ -177,32 +317,41 @@ def test_status_command(mock_db_class, mock_manager_class, runner, sample_nodes)
     mock_db.__aenter__ = AsyncMock(return_value=mock_db)
     mock_db.__aexit__ = AsyncMock()
     mock_db.initialize = AsyncMock()
-    mock_db.get_all_nodes = AsyncMock(return_value=sample_nodes)
-    mock_db_class.return_value = mock_db
+    mock_db.get_connected_nodes = AsyncMock(
+        return_value=[(node, "/dev/ttyUSB0") for node in sample_nodes]
+    )
+    use_mock_db(mock_db_class, mock_db)
 
     # Setup manager mock
     mock_manager = MagicMock()
-    statuses = [
-        NodeStatus(node=node, reachable=True, error=None) for node in sample_nodes
-    ]
-    mock_manager.check_all_reachability = AsyncMock(return_value=statuses)
+    mock_manager.check_all_reachability = AsyncMock(
+        side_effect=lambda nodes, connections, concurrency: [
+            NodeStatus(node=node, reachable=True, error=None) for node in nodes
+        ]
+    )
     mock_manager_class.return_value = mock_manager
 
-    result = runner.invoke(cli, ["status"])
+    result = runner.invoke(cli, ["status", "--concurrency", "2"])
 
     assert result.exit_code == 0
     assert "Checking status" in result.output
+    assert "3/3 node(s) reachable" in result.output
+    _, connections, concurrency = mock_manager.check_all_reachability.call_args.args
+    assert connections == {node.id: "/dev/ttyUSB0" for node in sample_nodes}
+    assert concurrency == 2
 
 
-@patch("nodepool.cli.AsyncDatabase")
+@patch("nodepool.database.AsyncDatabase")
 def test_export_command_json(mock_db_class, runner, sample_nodes):
     """Test export command with JSON format."""
     mock_db = MagicMock()
     mock_db.__aenter__ = AsyncMock(return_value=mock_db)
     mock_db.__aexit__ = AsyncMock()
     mock_db.initialize = AsyncMock()
-    mock_db.get_all_nodes = AsyncMock(return_value=sample_nodes)
-    mock_db_class.return_value = mock_db
+    mock_db.get_nodes_with_connections = AsyncMock(
+        return_value=[(node, None) for node in sample_nodes]
+    )
+    use_mock_db(mock_db_class, mock_db)
 
     result = runner.invoke(cli, ["export"])
 
@@ -211,15 +360,18 @@ def test_export_command_json(mock_db_class, runner, sample_nodes):
     assert sample_nodes[0].id in result.output
 
 
-@patch("nodepool.cli.AsyncDatabase")
+@patch("nodepool.database.AsyncDatabase")
 def test_export_command_to_file(mock_db_class, runner, sample_nodes, tmp_path):
     """Test export command with output file."""
     mock_db = MagicMock()
     mock_db.__aenter__ = AsyncMock(return_value=mock_db)
     mock_db.__aexit__ = AsyncMock()
     mock_db.initialize = AsyncMock()
-    mock_db.get_all_nodes = AsyncMock(return_value=sample_nodes)
-    mock_db_class.return_value = mock_db
+    sample_nodes[0].short_name = "🚀"
+    mock_db.get_nodes_with_connections = AsyncMock(
+        return_value=[(node, "/dev/ttyUSB0") for node in sample_nodes]
+    )
+    use_mock_db(mock_db_class, mock_db)
 
     output_file = tmp_path / "export.json"
     result = runner.invoke(cli, ["export", "-o", str(output_file)])
@@ -227,3 +379,345 @@ def test_export_command_to_file(mock_db_class, runner, sample_nodes, tmp_path):
     assert result.exit_code == 0
     assert output_file.exists()
     assert "Exported" in result.output
+
+    # Written as UTF-8 whatever the platform's locale encoding
+    exported = json.loads(output_file.read_text(encoding="utf-8"))
+    assert [entry["id"] for entry in exported] == [node.id for node in sample_nodes]
+    assert exported[0]["short_name"] == "🚀"
+    assert exported[0]["connection_string"] == "/dev/ttyUSB0"
+
+
+@patch("nodepool.database.AsyncDatabase")
+def test_export_command_yaml(mock_db_class, runner, sample_nodes, tmp_path):
+    """Test YAML export to stdout and to a file."""
+    yaml = pytest.importorskip("yaml")
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock(return_value=False)
+    mock_db.initialize = AsyncMock()
+    mock_db.get_nodes_with_connections = AsyncMock(
+        return_value=[(node, None) for node in sample_nodes]
+    )
+    use_mock_db(mock_db_class, mock_db)
+
+    result = runner.invoke(cli, ["export", "--format", "yaml"])
+    assert result.exit_code == 0
+    exported = yaml.safe_load(result.output)
+    assert [entry["id"] for entry in exported] == [node.id for node in sample_nodes]
+    # Keys keep the same order as the JSON export
+    assert [*exported[0]][:3] == ["id", "short_name", "long_name"]
+
+    output_file = tmp_path / "export.yaml"
+    result = runner.invoke(cli, ["export", "--format", "yaml", "-o", str(output_file)])
+    assert result.exit_code == 0
+    assert len(yaml.safe_load(output_file.read_text())) == len(sample_nodes)
+
+
+def test_iter_json_array_matches_json_dumps():
+    """Test streamed JSON output is identical to a single json.dumps call."""
+    records = [{"id": "!a", "config": {"lora": {"hop_limit": 3}}}, {"id": "!b", "config": {}}]
+
+    assert "".join(_iter_json_array(records, json.dumps)) == json.dumps(records, indent=2)
+    assert "".join(_iter_json_array([], json.dumps)) == json.dumps([], indent=2)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_export_serializer_round_trips(monkeypatch, use_orjson):
+    """Test both export serializers emit JSON that parses back to the same values."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        # A None entry makes "import orjson" raise ImportError
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    records = [
+        {"id": "!a", "short_name": "🚀", "long_name": "Café ☕", "snr": 6.25, "config": {}},
+        {"id": "!b", "short_name": "BIG", "config": {"counter": 2**70 + 1}},
+        {"id": "!c", "short_name": "EXP", "config": {"big": 1e16, "small": 1e-7}},
+    ]
+
+    output = "".join(_iter_json_array(records, _get_json_dumps()))
+
+    assert json.loads(output) == records
+    # Non-ASCII text is written unescaped by both
+    assert "🚀" in output
+    # Float formatting differs between the two serializers
+    assert ("1e16" in output) is use_orjson
+    assert ("1e+16" in output) is not use_orjson
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_export_serializer_non_finite_floats(monkeypatch, use_orjson):
+    """Test NaN is exported as null by orjson and as NaN by the standard library."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+    output = "".join(_iter_json_array([{"snr": float("nan")}], _get_json_dumps()))
+
+    snr = json.loads(output)[0]["snr"]
+    if use_orjson:
+        assert snr is None
+    else:
+        assert math.isnan(snr)
+
+
+@patch("nodepool.node_manager.NodeManager")
+@patch("nodepool.database.AsyncDatabase")
+def test_sync_command_continues_after_node_error(
+    mock_db_class, mock_manager_class, runner, sample_nodes
+):
+    """Test sync reports a failing managed node without aborting the others."""
+    managed_a, managed_b, heard = sample_nodes
+
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock()
+    mock_db.initialize = AsyncMock()
+    mock_db.get_connected_nodes = AsyncMock(
+        return_value=[(managed_a, "/dev/ttyUSB0"), (managed_b, "/dev/ttyUSB1")]
+    )
+    use_fake_batches(mock_db)
+    use_mock_db(mock_db_class, mock_db)
+
+    async def import_heard_nodes(serial_port, managed_node_id):
+        if serial_port == "/dev/ttyUSB0":
+            raise ConnectionError("port busy")
+        return [heard], []
+
+    mock_manager = MagicMock()
+    mock_manager.connect_to_node = AsyncMock(side_effect=lambda port: managed_b)
+    mock_manager.import_heard_nodes = AsyncMock(side_effect=import_heard_nodes)
+    mock_manager_class.return_value = mock_manager
+
+    result = runner.invoke(cli, ["sync"])
+
+    assert result.exit_code == 0
+    assert "port busy" in result.output
+    assert "Imported 1 heard node(s)" in result.output
+    assert "1 new: NODE3" in result.output
+
+
+@patch("nodepool.node_manager.NodeManager")
+@patch("nodepool.database.AsyncDatabase")
+def test_sync_command_isolates_save_failures(
+    mock_db_class, mock_manager_class, runner, sample_nodes
+):
+    """Test a failed heard import keeps the refresh and a failed save skips one node."""
+    managed_a, managed_b, heard = sample_nodes
+    saved_ids = []
+
+    @asynccontextmanager
+    async def batch():
+        write_batch = WriteBatch()
+        yield write_batch
+        queued = [row[0] for row in write_batch.node_rows]
+        if managed_b.id in queued:
+            raise RuntimeError("disk full")
+        saved_ids.extend(queued)
+
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock(return_value=False)
+    mock_db.initialize = AsyncMock()
+    mock_db.get_connected_nodes = AsyncMock(
+        return_value=[(managed_a, "/dev/ttyUSB0"), (managed_b, "/dev/ttyUSB1")]
+    )
+    mock_db.batch = batch
+    use_mock_db(mock_db_class, mock_db)
+
+    async def import_heard_nodes(serial_port, managed_node_id):
+        if serial_port == "/dev/ttyUSB0":
+            raise ConnectionError("port busy")
+        return [heard], []
+
+    mock_manager = MagicMock()
+    mock_manager.connect_to_node = AsyncMock(
+        side_effect=lambda port: managed_a if port == "/dev/ttyUSB0" else managed_b
+    )
+    mock_manager.import_heard_nodes = AsyncMock(side_effect=import_heard_nodes)
+    mock_manager_class.return_value = mock_manager
+
+    result = runner.invoke(cli, ["sync"])
+
+    assert result.exit_code == 0
+    assert saved_ids == [managed_a.id]
+    assert "Refreshed config for NODE1" in result.output
+    assert "port busy" in result.output
+    assert "disk full" in result.output
+    assert "Refreshed config for NODE2" not in result.output
+
+
+@patch("nodepool.node_manager.NodeManager")
+@patch("nodepool.database.AsyncDatabase")
+def test_sync_command_counts_overlapping_heard_nodes_once(
+    mock_db_class, mock_manager_class, runner, sample_nodes
+):
+    """Test a node heard by several managed nodes is only new the first time."""
+    managed_a, managed_b, heard = sample_nodes
+
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock()
+    mock_db.initialize = AsyncMock()
+    mock_db.get_connected_nodes = AsyncMock(
+        return_value=[(managed_a, "/dev/ttyUSB0"), (managed_b, "/dev/ttyUSB1")]
+    )
+    use_fake_batches(mock_db)
+    use_mock_db(mock_db_class, mock_db)
+
+    mock_manager = MagicMock()
+    mock_manager.connect_to_node = AsyncMock(side_effect=lambda port: managed_a)
+    mock_manager.import_heard_nodes = AsyncMock(return_value=([heard], []))
+    mock_manager_class.return_value = mock_manager
+
+    result = runner.invoke(cli, ["sync"])
+
+    assert result.exit_code == 0
+    assert result.output.count("1 new: NODE3") == 1
+    assert "1 updated" in result.output
+
+
+@patch("nodepool.database.AsyncDatabase")
+def test_heard_command(mock_db_class, runner, sample_node):
+    """Test heard command formats signal and last-seen columns."""
+    heard = sample_node.model_copy(
+        update={
+            "snr": 6.25,
+            "last_seen": datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc),
+        }
+    )
+
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock()
+    mock_db.initialize = AsyncMock()
+    mock_db.get_heard_nodes = AsyncMock(return_value=[heard])
+    use_mock_db(mock_db_class, mock_db)
+
+    result = runner.invoke(cli, ["heard"])
+
+    assert result.exit_code == 0
+    assert "6.2" in result.output
+    # The column may wrap between date and time at the default width
+    assert "2025-01-01" in result.output
+    assert "12:30" in result.output
+    assert "+00:00" not in result.output
+
+
+@patch("nodepool.meshview_api.MeshViewAPIClient")
+@patch("nodepool.database.AsyncDatabase")
+def test_sync_meshview_saves_each_page(mock_db_class, mock_client_class, runner, sample_nodes):
+    """Test sync-meshview saves every fetched page and reports totals."""
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock()
+    mock_db.initialize = AsyncMock()
+    use_fake_batches(mock_db, stored_ids={sample_nodes[0].id})
+    use_mock_db(mock_db_class, mock_db)
+
+    async def fetch_node_pages(days_active):
+        yield sample_nodes[:2], []
+        yield sample_nodes[2:], []
+
+    mock_client = MagicMock()
+    mock_client.fetch_node_pages = fetch_node_pages
+    mock_client_class.return_value = mock_client
+
+    result = runner.invoke(cli, ["sync-meshview"])
+
+    assert result.exit_code == 0
+    assert "Fetched 2 node(s) from API" in result.output
+    assert "Fetched 1 node(s) from API" in result.output
+    assert "Successfully synced 3 node(s)" in result.output
+    assert "2 new node(s)" in result.output
+    assert "1 updated node(s)" in result.output
+
+
+@patch("nodepool.meshview_api.MeshViewAPIClient")
+@patch("nodepool.database.AsyncDatabase")
+def test_sync_meshview_traceback_only_with_verbose(mock_db_class, mock_client_class, runner):
+    """Test sync-meshview reports API errors briefly unless --verbose is given."""
+    mock_db = MagicMock()
+    mock_db.initialize = AsyncMock()
+    use_mock_db(mock_db_class, mock_db)
+
+    async def fetch_node_pages(days_active):
+        raise ValueError("bad payload")
+        yield
+
+    mock_client_class.return_value.fetch_node_pages = fetch_node_pages
+
+    result = runner.invoke(cli, ["sync-meshview"])
+    assert "Error fetching from MeshView API: ValueError: bad payload" in result.output
+    assert "Traceback" not in result.output
+
+    result = runner.invoke(cli, ["sync-meshview", "--verbose"])
+    assert "Traceback" in result.output
+
+
+@patch("nodepool.meshview_api.MeshViewAPIClient")
+@patch("nodepool.database.AsyncDatabase")
+def test_sync_meshview_fetch_error_not_masked_by_save_error(
+    mock_db_class, mock_client_class, runner, sample_nodes
+):
+    """Test a failing last save doesn't hide the fetch error or earlier saved pages."""
+
+    @asynccontextmanager
+    async def batch():
+        write_batch = WriteBatch()
+        yield write_batch
+        if sample_nodes[2].id in {row[0] for row in write_batch.node_rows}:
+            raise RuntimeError("disk full")
+        write_batch.new_node_ids = {row[0] for row in write_batch.node_rows}
+
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock(return_value=False)
+    mock_db.initialize = AsyncMock()
+    mock_db.batch = batch
+    use_mock_db(mock_db_class, mock_db)
+
+    async def fetch_node_pages(days_active):
+        yield sample_nodes[:2], []
+        yield sample_nodes[2:], []
+        raise ValueError("bad payload")
+
+    mock_client_class.return_value.fetch_node_pages = fetch_node_pages
+
+    result = runner.invoke(cli, ["sync-meshview"])
+
+    assert "Error fetching from MeshView API: ValueError: bad payload" in result.output
+    assert "disk full" not in result.output
+    assert "2 node(s) from earlier pages were saved (2 new, 0 updated)" in result.output
+
+
+def test_uvloop_factory_skipped_on_windows(monkeypatch):
+    """Test the default event loop is used on Windows."""
+    monkeypatch.setattr("nodepool.cli.sys.platform", "win32")
+
+    assert _uvloop_factory() is None
+
+
+def test_run_async_reuses_runner():
+    """Test that commands in one process share a single event loop runner."""
+
+    async def _loop():
+        return asyncio.get_running_loop()
+
+    assert run_async(_loop()) is run_async(_loop())
+
+
+@patch("nodepool.node_manager.NodeManager")
+def test_connection_add_failure_traceback_only_with_verbose(mock_manager_class, runner):
+    """Test connection add prints the traceback only when --verbose is given."""
+    mock_manager = MagicMock()
+    mock_manager.connect_to_node = AsyncMock(side_effect=RuntimeError("port busy"))
+    mock_manager_class.return_value = mock_manager
+
+    result = runner.invoke(cli, ["connection", "add", "/dev/ttyUSB0"])
+    assert "Failed to connect: port busy" in result.output
+    assert "Traceback" not in result.output
+
+    result = runner.invoke(cli, ["connection", "add", "/dev/ttyUSB0", "--verbose"])
+    assert "Traceback" in result.output
@@ -1,16 +1,13 @@
 """Tests for configuration checker."""
 
-import pytest
-
 from nodepool.config_checker import ConfigChecker
 from nodepool.models import Node
 
 
-@pytest.mark.asyncio
-async def test_check_ttl_pass(sample_node):
+def test_check_ttl_pass(sample_node):
     """Test TTL check passes when value matches."""
     checker = ConfigChecker(expected_ttl=7)
-    result = await checker.check_ttl(sample_node)
+    result = checker.check_ttl(sample_node)
 
     assert result.status == "pass"
     assert result.check_type == "ttl"
@@ -18,8 +15,7 @@ async def test_check_ttl_pass(sample_node):
     assert result.actual_value == 7
 
 
-@pytest.mark.asyncio
-async def test_check_ttl_fail():
+def test_check_ttl_fail():
     """Test TTL check fails when value doesn't match."""
     node = Node(
         id="!test",
@@ -29,15 +25,14 @@ async def test_check_ttl_fail():
     )
 
     checker = ConfigChecker(expected_ttl=7)
-    result = await checker.check_ttl(node)
+    result = checker.check_ttl(node)
 
     assert result.status == "fail"
     assert result.expected_value == 7
     assert result.actual_value == 3
 
 
-@pytest.mark.asyncio
-async def test_check_ttl_warning_missing():
+def test_check_ttl_warning_missing():
     """Test TTL check warns when value is missing."""
     node = Node(
         id="!test",
@@ -47,17 +42,16 @@ async def test_check_ttl_warning_missing():
     )
 
     checker = ConfigChecker(expected_ttl=7)
-    result = await checker.check_ttl(node)
+    result = checker.check_ttl(node)
 
     assert result.status == "warning"
     assert result.actual_value is None
 
 
-@pytest.mark.asyncio
-async def test_check_region_pass(sample_node):
+def test_check_region_pass(sample_node):
     """Test region check passes when value matches."""
     checker = ConfigChecker(expected_region="US")
-    result = await checker.check_region(sample_node)
+    result = checker.check_region(sample_node)
 
     assert result.status == "pass"
     assert result.check_type == "region"
@@ -65,8 +59,7 @@ async def test_check_region_pass(sample_node):
     assert result.actual_value == "US"
 
 
-@pytest.mark.asyncio
-async def test_check_region_fail():
+def test_check_region_fail():
     """Test region check fails when value doesn't match."""
     node = Node(
         id="!test",
@@ -76,15 +69,14 @@ async def test_check_region_fail():
     )
 
     checker = ConfigChecker(expected_region="US")
-    result = await checker.check_region(node)
+    result = checker.check_region(node)
 
     assert result.status == "fail"
     assert result.expected_value == "US"
     assert result.actual_value == "EU_868"
 
 
-@pytest.mark.asyncio
-async def test_check_region_skipped_when_not_configured():
+def test_check_region_skipped_when_not_configured():
     """Test region check is skipped when no expected region."""
     checker = ConfigChecker(expected_region=None)
     node = Node(
@@ -94,14 +86,13 @@ async def test_check_region_skipped_when_not_configured():
         config={"lora": {"region": "US"}},
     )
 
-    result = await checker.check_region(node)
+    result = checker.check_region(node)
 
     assert result.status == "pass"
     assert "skipped" in result.message.lower()
 
 
-@pytest.mark.asyncio
-async def test_check_channel_present():
+def test_check_channel_present():
     """Test channel check when channel is present."""
     node = Node(
         id="!test",
@@ -116,14 +107,13 @@ async def test_check_channel_present():
     )
 
     checker = ConfigChecker(expected_channels=[{"name": "Secondary"}])
-    result = await checker.check_channel(node, channel_index=1)
+    result = checker.check_channel(node, channel_index=1)
 
     assert result.status == "pass"
     assert "configured" in result.message.lower()
 
 
-@pytest.mark.asyncio
-async def test_check_channel_missing():
+def test_check_channel_missing():
     """Test channel check when channel is missing."""
     node = Node(
         id="!test",
@@ -133,28 +123,26 @@ async def test_check_channel_missing():
     )
 
     checker = ConfigChecker(expected_channels=[{"name": "Secondary"}])
-    result = await checker.check_channel(node, channel_index=1)
+    result = checker.check_channel(node, channel_index=1)
 
     assert result.status == "warning"
     assert "not configured" in result.message.lower()
 
 
-@pytest.mark.asyncio
-async def test_check_node_all_checks(sample_node):
+def test_check_node_all_checks(sample_node):
     """Test running all checks on a node."""
     checker = ConfigChecker(expected_ttl=7, expected_region="US")
-    results = await checker.check_node(sample_node)
+    results = checker.check_node(sample_node)
 
     assert len(results) >= 2  # At least TTL and region
     assert any(r.check_type == "ttl" for r in results)
     assert any(r.check_type == "region" for r in results)
 
 
-@pytest.mark.asyncio
-async def test_check_all_nodes(sample_nodes):
+def test_check_all_nodes(sample_nodes):
     """Test running checks on multiple nodes."""
     checker = ConfigChecker(expected_ttl=7, expected_region="US")
-    results = await checker.check_all_nodes(sample_nodes)
+    results = checker.check_all_nodes(sample_nodes)
 
     # Should have checks for all nodes
     assert len(results) >= len(sample_nodes) * 2  # At least TTL and region per node
@@ -164,8 +152,27 @@ async def test_check_all_nodes(sample_nodes):
     assert len(node_ids) == len(sample_nodes)
 
 
-@pytest.mark.asyncio
-async def test_check_with_custom_ttl():
+def test_check_all_nodes_preserves_node_order(sample_nodes):
+    """Test checks are returned grouped by node, in input node order."""
+    checker = ConfigChecker(expected_ttl=7, expected_region="US")
+    results = checker.check_all_nodes(sample_nodes)
+
+    ordered_ids = list(dict.fromkeys(r.node_id for r in results))
+    assert ordered_ids == [node.id for node in sample_nodes]
+
+
+def test_iter_checks_is_lazy(sample_nodes):
+    """Test iter_checks only checks nodes as results are consumed."""
+    checker = ConfigChecker()
+    results = checker.iter_checks(sample_nodes)
+
+    first = next(results)
+
+    assert first.node_id == sample_nodes[0].id
+    assert [*results][-1].node_id == sample_nodes[-1].id
+
+
+def test_check_with_custom_ttl():
     """Test configuration checker with custom TTL."""
     node = Node(
         id="!test",
@@ -175,17 +182,16 @@ async def test_check_with_custom_ttl():
     )
 
     checker = ConfigChecker(expected_ttl=5)
-    result = await checker.check_ttl(node)
+    result = checker.check_ttl(node)
 
     assert result.status == "pass"
     assert result.expected_value == 5
 
 
-@pytest.mark.asyncio
-async def test_mixed_check_results(sample_nodes):
+def test_mixed_check_results(sample_nodes):
     """Test that checks properly identify pass/fail/warning."""
     checker = ConfigChecker(expected_ttl=7, expected_region="US")
-    results = await checker.check_all_nodes(sample_nodes)
+    results = checker.check_all_nodes(sample_nodes)
 
     # Should have passing checks
     assert any(r.status == "pass" for r in results)
@@ -197,3 +203,81 @@ async def test_mixed_check_results(sample_nodes):
     node2_ttl_checks = [r for r in results if r.node_id == "!def456" and r.check_type == "ttl"]
     assert len(node2_ttl_checks) == 1
     assert node2_ttl_checks[0].status == "fail"
+
+
+def test_check_node_matches_individual_checks():
+    """Test check_node gives the same results as the public per-check methods."""
+    node = Node(
+        id="!sec",
+        short_name="SEC",
+        long_name="Secure Node",
+        config={
+            "lora": {"hopLimit": 3, "region": "EU_868"},
+            "security": {"admin_key_set": True, "admin_key": "01", "serial_enabled": False},
+            "channels": [{"index": 0, "name": "Primary", "psk_set": True, "psk": "abcdef0123"}],
+        },
+    )
+    checker = ConfigChecker(expected_ttl=7, expected_region="US")
+
+    expected = [
+        checker.check_ttl(node),
+        checker.check_region(node),
+        checker.check_admin_key(node),
+        checker.check_serial_disabled(node),
+        *checker.check_channel_encryption(node),
+    ]
+    exclude = {"timestamp"}
+    assert [check.model_dump(exclude=exclude) for check in checker.check_node(node)] == [
+        check.model_dump(exclude=exclude) for check in expected
+    ]
+    assert [check.status for check in expected] == ["fail", "fail", "fail", "pass", "pass"]
+
+
+def test_check_ttl_warning_null_section():
+    """Test a section stored as null is treated like a missing one."""
+    node = Node(id="!null", short_name="NULL", long_name="Null Node", config={"lora": None})
+
+    result = ConfigChecker().check_ttl(node)
+
+    assert result.status == "warning"
+    assert result.actual_value is None
+
+
+def test_check_channel_encryption():
+    """Test each channel is reported as encrypted or not, with a name fallback."""
+    node = Node(
+        id="!chan",
+        short_name="CHAN",
+        long_name="Channel Node",
+        config={
+            "channels": [
+                {"index": 0, "name": "Primary", "psk_set": True, "psk": "abcdef0123"},
+                {"index": 1, "psk_set": False},
+            ]
+        },
+    )
+
+    primary, secondary = ConfigChecker().check_channel_encryption(node)
+
+    assert primary.status == "pass"
+    assert primary.actual_value == "PSK: abcdef01..."
+    assert secondary.status == "warning"
+    assert secondary.message == "Channel 1 is not encrypted"
+
+
+def test_check_admin_key_flags_weak_keys():
+    """Test default and all-zero admin keys fail while other keys pass."""
+    checker = ConfigChecker()
+
+    def admin_status(admin_key):
+        node = Node(
+            id="!adm",
+            short_name="ADM",
+            long_name="Admin Node",
+            config={"security": {"admin_key_set": True, "admin_key": admin_key}},
+        )
+        return checker.check_admin_key(node).status
+
+    assert admin_status("01") == "fail"
+    assert admin_status("00" * 32) == "fail"
+    assert admin_status("5a" * 32) == "pass"
@@ -1,11 +1,12 @@
 """Tests for database operations."""
 
+import math
 from datetime import datetime
 
 import pytest
 
 from nodepool.database import AsyncDatabase
-from nodepool.models import ConfigCheck, ConfigSnapshot, Node
+from nodepool.models import ConfigCheck, ConfigSnapshot, HeardHistory, Node
 
 
 @pytest.mark.asyncio
@@ -22,6 +23,18 @@ async def test_database_initialization(db):
     assert "config_checks" in tables
 
 
+@pytest.mark.asyncio
+async def test_heard_history_lookup_uses_composite_index(db):
+    """Test heard-by lookups are answered from the (seen_by, node_id) index."""
+    cursor = await db._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT 1 FROM heard_history WHERE seen_by = ? AND node_id = ?",
+        ("!abc123", "!def456"),
+    )
+    plan = " ".join(row["detail"] for row in await cursor.fetchall())
+
+    assert "COVERING INDEX idx_heard_by_node" in plan
+
+
 @pytest.mark.asyncio
 async def test_save_and_get_node(db, sample_node):
     """Test saving and retrieving a node."""
@@ -199,3 +212,270 @@ async def test_node_ordering(db):
     nodes = await db.get_all_nodes()
     names = [node.short_name for node in nodes]
     assert names == ["ALPHA", "BRAVO", "CHARLIE"]
+
+
+@pytest.mark.asyncio
+async def test_get_existing_ids(db_with_nodes):
+    """Test batched lookup of which node IDs already exist."""
+    existing = await db_with_nodes.get_existing_ids(["!abc123", "!ghi789", "!missing"])
+    assert existing == {"!abc123", "!ghi789"}
+
+    assert await db_with_nodes.get_existing_ids([]) == set()
+
+
+@pytest.mark.asyncio
+async def test_get_existing_ids_chunks_large_input(db_with_nodes):
+    """Test lookups larger than one IN (...) chunk."""
+    ids = [f"!missing{i}" for i in range(1200)] + ["!def456"]
+    assert await db_with_nodes.get_existing_ids(ids) == {"!def456"}
+
+
+@pytest.mark.asyncio
+async def test_batch_writes_nodes_and_history(db, sample_nodes):
+    """Test that a batch flushes queued nodes and heard history on exit."""
+    async with db.batch() as batch:
+        for node in sample_nodes:
+            batch.upsert_node(node)
+        batch.insert_history(
+            HeardHistory(node_id="!def456", long_name="Test Node 2", seen_by="!abc123", snr=4.5)
+        )
+
+    nodes = await db.get_all_nodes(active_only=False)
+    assert len(nodes) == 3
+
+    cursor = await db._conn.execute("SELECT COUNT(*) FROM heard_history")
+    assert (await cursor.fetchone())[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_new_node_ids(db, sample_nodes):
+    """Test that a flushed batch reports which queued nodes were inserted."""
+    await db.save_node(sample_nodes[0])
+
+    async with db.batch() as batch:
+        for node in sample_nodes:
+            batch.upsert_node(node)
+
+    assert batch.new_node_ids == {sample_nodes[1].id, sample_nodes[2].id}
+
+
+@pytest.mark.asyncio
+async def test_batch_writes_connections(db, sample_nodes):
+    """Test that nodes and their connections are saved in one batch."""
+    async with db.batch() as batch:
+        for port, node in enumerate(sample_nodes[:2]):
+            batch.upsert_node(node)
+            batch.save_connection(node.id, f"/dev/ttyUSB{port}")
+
+    connected = await db.get_connected_nodes()
+    assert {(n.id, p) for n, p in connected} == {
+        (sample_nodes[0].id, "/dev/ttyUSB0"),
+        (sample_nodes[1].id, "/dev/ttyUSB1"),
+    }
+
+    on_port = await db.get_connected_nodes("/dev/ttyUSB1")
+    assert [(n.id, p) for n, p in on_port] == [(sample_nodes[1].id, "/dev/ttyUSB1")]
+
+
+@pytest.mark.asyncio
+async def test_batch_discarded_on_error(db, sample_node):
+    """Test that nothing is written when the batch block raises."""
+    with pytest.raises(RuntimeError):
+        async with db.batch() as batch:
+            batch.upsert_node(sample_node)
+            raise RuntimeError("boom")
+
+    assert await db.get_node(sample_node.id) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_writes_config_checks(db, sample_node):
+    """Test that config checks queued on a batch are saved."""
+    await db.save_node(sample_node)
+
+    async with db.batch() as batch:
+        for check_type in ("ttl", "region"):
+            batch.insert_config_check(
+                ConfigCheck(
+                    node_id=sample_node.id,
+                    check_type=check_type,
+                    expected_value=7,
+                    actual_value=7,
+                    status="pass",
+                    message="ok",
+                )
+            )
+
+    checks = await db.get_latest_checks(node_id=sample_node.id)
+    assert {c.check_type for c in checks} == {"ttl", "region"}
+
+
+@pytest.mark.asyncio
+async def test_get_all_nodes_managed_filter(db_with_nodes):
+    """Test filtering nodes by whether they have a managed connection."""
+    await db_with_nodes.save_connection("!abc123", "/dev/ttyUSB0")
+
+    managed = await db_with_nodes.get_all_nodes(active_only=False, managed=True)
+    assert [n.id for n in managed] == ["!abc123"]
+
+    unmanaged = await db_with_nodes.get_all_nodes(active_only=False, managed=False)
+    assert {n.id for n in unmanaged} == {"!def456", "!ghi789"}
+
+    active_unmanaged = await db_with_nodes.get_all_nodes(managed=False)
+    assert [n.id for n in active_unmanaged] == ["!def456"]
+
+
+async def test_acquire_reuses_connection(tmp_path):
+    """Test acquire hands out one shared connection per database path."""
+    db_path = tmp_path / "pool.db"
+    try:
+        async with AsyncDatabase.acquire(db_path) as first:
+            await first.initialize()
+        async with AsyncDatabase.acquire(str(db_path)) as second:
+            assert second is first
+            assert second._conn is not None
+    finally:
+        await AsyncDatabase.close_pool()
+
+    assert first._conn is None
+    async with AsyncDatabase.acquire(db_path) as reopened:
+        assert reopened is not first
+    await AsyncDatabase.close_pool()
+
+
+@pytest.mark.asyncio
+async def test_initialize_runs_once_per_connection(tmp_path):
+    """Test repeated initialize calls skip the schema script until reconnect."""
+    database = AsyncDatabase(tmp_path / "init.db")
+    await database.initialize()
+    await database._conn.execute("DROP TABLE heard_history")
+
+    await database.initialize()
+    cursor = await database._conn.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'heard_history'"
+    )
+    assert await cursor.fetchone() is None
+
+    await database.close()
+    await database.initialize()
+    cursor = await database._conn.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'heard_history'"
+    )
+    assert await cursor.fetchone() is not None
+    await database.close()
+
+
+@pytest.mark.asyncio
+async def test_connect_enables_wal(tmp_path):
+    """Test file databases are opened in WAL mode with a busy timeout."""
+    database = AsyncDatabase(tmp_path / "wal.db")
+    await database.connect()
+    try:
+        cursor = await database._conn.execute("PRAGMA journal_mode")
+        assert (await cursor.fetchone())[0] == "wal"
+        cursor = await database._conn.execute("PRAGMA busy_timeout")
+        assert (await cursor.fetchone())[0] == 5000
+    finally:
+        await database.close()
+
+
+@pytest.mark.asyncio
+async def test_get_nodes_with_connections(db, sample_nodes):
+    """Test that nodes are returned with their connection string or None."""
+    for node in sample_nodes:
+        await db.save_node(node)
+    await db.save_connection(sample_nodes[0].id, "/dev/ttyUSB0")
+
+    rows = await db.get_nodes_with_connections(active_only=False)
+    assert {node.id: conn for node, conn in rows} == {
+        "!abc123": "/dev/ttyUSB0",
+        "!def456": None,
+        "!ghi789": None,
+    }
+
+    active = await db.get_nodes_with_connections()
+    assert "!ghi789" not in {node.id for node, _ in active}
+
+
+@pytest.mark.asyncio
+async def test_get_all_node_ids(db, sample_nodes):
+    """Test that every stored node ID is returned, active or not."""
+    for node in sample_nodes:
+        await db.save_node(node)
+
+    assert await db.get_all_node_ids() == {"!abc123", "!def456", "!ghi789"}
+
+
+@pytest.mark.asyncio
+async def test_get_heard_nodes_seen_by(db, sample_nodes):
+    """Test heard nodes are filtered by observer and listed once each."""
+    for node in sample_nodes:
+        await db.save_node(node)
+    await db.save_connection(sample_nodes[0].id, "/dev/ttyUSB0")
+    for _ in range(2):
+        await db.save_heard_history(
+            HeardHistory(node_id="!def456", long_name="Test Node 2", seen_by="!abc123")
+        )
+
+    heard = await db.get_heard_nodes(seen_by="!abc123")
+    assert [n.id for n in heard] == ["!def456"]
+
+    assert await db.get_heard_nodes(seen_by="!def456") == []
+    assert {n.id for n in await db.get_heard_nodes()} == {"!def456", "!ghi789"}
+
+
+@pytest.mark.asyncio
+async def test_iter_nodes_matches_get_all_nodes(db_with_nodes):
+    """Test iter_nodes yields the same nodes, in order, as get_all_nodes."""
+    streamed = [node.id async for node in db_with_nodes.iter_nodes(active_only=False)]
+
+    assert streamed == [n.id for n in await db_with_nodes.get_all_nodes(active_only=False)]
+    assert len(streamed) == 3
+
+
+@pytest.mark.asyncio
+async def test_config_json_round_trip(db, sample_node):
+    """Test nested config and check values survive the JSON columns intact."""
+    sample_node.config["channels"] = [{"index": 0, "settings": {"psk": "AQ==", "name": None}}]
+    await db.save_node(sample_node)
+    await db.save_config_check(
+        ConfigCheck(
+            node_id=sample_node.id,
+            check_type="channel",
+            expected_value=["LongFast", 2**40],
+            actual_value=None,
+            status="fail",
+            message="Channel mismatch",
+        )
+    )
+
+    assert (await db.get_node(sample_node.id)).config == sample_node.config
+    check = (await db.get_latest_checks(sample_node.id))[0]
+    assert check.expected_value == ["LongFast", 2**40]
+    assert check.actual_value is None
+
+
+@pytest.mark.asyncio
+async def test_non_finite_floats_round_trip(db, sample_node):
+    """Test NaN/Infinity written by the stdlib are still readable with orjson installed."""
+    pytest.importorskip("orjson")
+    sample_node.config["lora"]["snr"] = float("nan")
+    await db.save_node(sample_node)
+    await db.save_config_check(
+        ConfigCheck(
+            node_id=sample_node.id,
+            check_type="snr",
+            expected_value=float("inf"),
+            actual_value=float("-inf"),
+            status="warning",
+            message="SNR out of range",
+        )
+    )
+
+    cursor = await db._conn.execute("SELECT config FROM nodes WHERE id = ?", (sample_node.id,))
+    assert "NaN" in (await cursor.fetchone())["config"]
+
+    assert math.isnan((await db.get_node(sample_node.id)).config["lora"]["snr"])
+    check = (await db.get_latest_checks(sample_node.id))[0]
+    assert check.expected_value == float("inf")
+    assert check.actual_value == float("-inf")
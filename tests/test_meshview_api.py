@@ -1,7 +1,7 @@
 """Tests for MeshView API client."""
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aiohttp import ClientError
@@ -167,6 +167,45 @@ class TestMeshViewAPIClient:
             assert nodes[0].id == "!valid123"
             assert nodes[1].id == "!another"
 
+    async def test_fetch_node_pages(self, api_client, sample_api_response):
+        """Test nodes are yielded in pages from a single API request."""
+        with patch("aiohttp.ClientSession.get") as mock_get:
+            mock_response = AsyncMock()
+            mock_response.raise_for_status = AsyncMock()
+            mock_response.json = AsyncMock(return_value=sample_api_response)
+            mock_get.return_value.__aenter__.return_value = mock_response
+
+            pages = [
+                page async for page in api_client.fetch_node_pages(days_active=3, page_size=2)
+            ]
+
+            mock_get.assert_called_once()
+            assert [len(nodes) for nodes, _ in pages] == [2, 1]
+            assert [len(history) for _, history in pages] == [2, 1]
+            assert pages[1][0][0].id == "!xyz789"
+
+    async def test_fetch_nodes_uses_fresh_cache(self, sample_api_response, tmp_path):
+        """Test a cached response is reused until it expires."""
+        client = MeshViewAPIClient(base_url="https://test.example.com", cache_dir=tmp_path)
+        with patch("aiohttp.ClientSession.get") as mock_get:
+            mock_response = AsyncMock()
+            mock_response.raise_for_status = MagicMock()
+            mock_response.json = AsyncMock(return_value=sample_api_response)
+            mock_get.return_value.__aenter__.return_value = mock_response
+
+            first, _ = await client.fetch_nodes(days_active=3)
+            second, _ = await client.fetch_nodes(days_active=3)
+            assert mock_get.call_count == 1
+            assert [n.id for n in second] == [n.id for n in first]
+
+            # A different query is cached separately
+            await client.fetch_nodes(days_active=7)
+            assert mock_get.call_count == 2
+
+            client.cache_ttl = 0
+            await client.fetch_nodes(days_active=3)
+            assert mock_get.call_count == 3
+
     async def test_parse_node_timestamp_formats(self, api_client):
         """Test parsing different timestamp formats."""
         now = datetime.now(timezone.utc)
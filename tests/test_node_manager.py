@@ -1,10 +1,11 @@
 """Tests for node manager."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from nodepool.node_manager import NodeManager
+from nodepool.node_manager import NodeManager, _open_serial_interface
 
 
 @pytest.fixture
@@ -85,6 +86,19 @@ async def test_scan_port_success(mock_interface_class, mock_serial_interface):
     assert node.config["lora"]["hopLimit"] == 7
 
 
+@patch("meshtastic.serial_interface.SerialInterface")
+def test_open_serial_interface_sets_low_latency(mock_interface_class, monkeypatch):
+    """Test serial ports are switched to low-latency mode on Linux, best effort."""
+    monkeypatch.setattr("nodepool.node_manager.sys.platform", "linux")
+    interface = mock_interface_class.return_value
+
+    assert _open_serial_interface("/dev/ttyUSB0") is interface
+    interface.stream.set_low_latency_mode.assert_called_once_with(True)
+
+    interface.stream.set_low_latency_mode.side_effect = ValueError("not supported")
+    assert _open_serial_interface("/dev/ttyACM0") is interface
+
+
 @pytest.mark.asyncio
 @patch("meshtastic.serial_interface.SerialInterface")
 async def test_scan_port_no_node_info(mock_interface_class):
@@ -200,6 +214,35 @@ async def test_check_all_reachability(mock_interface_class, mock_serial_interfac
     assert all(isinstance(status.reachable, bool) for status in statuses)
 
 
+@pytest.mark.asyncio
+async def test_check_all_reachability_bounds_concurrency(sample_nodes):
+    """Test probes use each node's port and never exceed the concurrency limit."""
+    from nodepool.models import NodeStatus
+
+    manager = NodeManager()
+    active = 0
+    peak = 0
+    probed = {}
+
+    async def check_node_reachability(node, serial_port=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        probed[node.id] = serial_port
+        return NodeStatus(node=node, reachable=True)
+
+    manager.check_node_reachability = check_node_reachability
+    connections = {node.id: f"/dev/ttyUSB{i}" for i, node in enumerate(sample_nodes)}
+
+    statuses = await manager.check_all_reachability(sample_nodes, connections, concurrency=2)
+
+    assert [status.node.id for status in statuses] == [node.id for node in sample_nodes]
+    assert probed == connections
+    assert peak == 2
+
+
 def test_extract_config_minimal():
     """Test config extraction with minimal interface."""
     manager = NodeManager()